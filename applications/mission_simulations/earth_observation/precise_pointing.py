@@ -3,45 +3,152 @@ Precise pointing simulation for Earth observation missions
 """
 
 import numpy as np
-from scipy.integrate import solve_ivp
+from scipy.integrate import ode, solve_ivp
+from scipy.optimize import OptimizeResult
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; kernels then run as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, fastmath=True)
+def _quaternion_rate(q, w, out):
+    """Quaternion kinematics q_dot = 0.5 * Omega(w) @ q, written into out"""
+    q0, q1, q2, q3 = q[0], q[1], q[2], q[3]
+    wx, wy, wz = w[0], w[1], w[2]
+
+    out[0] = 0.5 * (-wx*q1 - wy*q2 - wz*q3)
+    out[1] = 0.5 * (wx*q0 + wz*q2 - wy*q3)
+    out[2] = 0.5 * (wy*q0 - wz*q1 + wx*q3)
+    out[3] = 0.5 * (wz*q0 + wy*q1 - wx*q2)
+
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _angular_acceleration(w, inertia, inertia_inv, torque, out):
+    """Euler's equations w_dot = I^-1 (torque - w x I w), written into out"""
+    wx, wy, wz = w[0], w[1], w[2]
+
+    # Angular momentum h = I @ w
+    hx = inertia[0, 0]*wx + inertia[0, 1]*wy + inertia[0, 2]*wz
+    hy = inertia[1, 0]*wx + inertia[1, 1]*wy + inertia[1, 2]*wz
+    hz = inertia[2, 0]*wx + inertia[2, 1]*wy + inertia[2, 2]*wz
+
+    # Net torque: external minus gyroscopic term w x h
+    mx = torque[0] - (wy*hz - wz*hy)
+    my = torque[1] - (wz*hx - wx*hz)
+    mz = torque[2] - (wx*hy - wy*hx)
+
+    out[0] = inertia_inv[0, 0]*mx + inertia_inv[0, 1]*my + inertia_inv[0, 2]*mz
+    out[1] = inertia_inv[1, 0]*mx + inertia_inv[1, 1]*my + inertia_inv[1, 2]*mz
+    out[2] = inertia_inv[2, 0]*mx + inertia_inv[2, 1]*my + inertia_inv[2, 2]*mz
+
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _attitude_rhs(state, inertia, inertia_inv, torque):
+    """Quaternion kinematics and Euler's equations for a rigid body"""
+    # A fresh array per call: solve_ivp keeps a reference to the last
+    # derivative across steps, so a reused buffer would be overwritten
+    state_dot = np.empty(7)
+
+    # Quaternion kinematics
+    _quaternion_rate(state[0:4], state[4:7], state_dot[0:4])
+
+    # Euler's equations for rigid body rotation
+    _angular_acceleration(state[4:7], inertia, inertia_inv, torque, state_dot[4:7])
+
+    return state_dot
+
+
+@njit(cache=True, fastmath=True)
+def _lie_group_attitude(state0, inertia, inertia_inv, torques, dt, n_steps):
+    """
+    Fixed-step attitude propagation that keeps the quaternion unit-norm.
+
+    w is advanced with classical RK4 (torques sampled every dt/2) and q is
+    rotated by the exponential map q <- q * exp(0.5*dt*w_avg) rather than
+    incremented, so |q| = 1 holds to rounding for any step size.
+    """
+    out = np.empty((n_steps + 1, 7))
+    out[0, :] = state0
+
+    w = state0[4:7].copy()
+    w_new = np.empty(3)
+    w_tmp = np.empty(3)
+    k1 = np.empty(3)
+    k2 = np.empty(3)
+    k3 = np.empty(3)
+    k4 = np.empty(3)
+
+    for n in range(n_steps):
+        # RK4 step for Euler's equations
+        _angular_acceleration(w, inertia, inertia_inv, torques[2*n], k1)
+        for j in range(3):
+            w_tmp[j] = w[j] + 0.5*dt*k1[j]
+        _angular_acceleration(w_tmp, inertia, inertia_inv, torques[2*n + 1], k2)
+        for j in range(3):
+            w_tmp[j] = w[j] + 0.5*dt*k2[j]
+        _angular_acceleration(w_tmp, inertia, inertia_inv, torques[2*n + 1], k3)
+        for j in range(3):
+            w_tmp[j] = w[j] + dt*k3[j]
+        _angular_acceleration(w_tmp, inertia, inertia_inv, torques[2*n + 2], k4)
+        for j in range(3):
+            w_new[j] = w[j] + dt/6.0*(k1[j] + 2.0*k2[j] + 2.0*k3[j] + k4[j])
+
+        # Rotation increment [cos(a), sin(a) * w/|w|] with a = 0.5*dt*|w_avg|
+        wx = 0.5*(w[0] + w_new[0])
+        wy = 0.5*(w[1] + w_new[1])
+        wz = 0.5*(w[2] + w_new[2])
+        w_mag = np.sqrt(wx*wx + wy*wy + wz*wz)
+        a = 0.5*dt*w_mag
+        c = np.cos(a)
+        s = np.sin(a)/w_mag if w_mag > 0.0 else 0.5*dt
+        p1, p2, p3 = s*wx, s*wy, s*wz
+
+        q0, q1, q2, q3 = out[n, 0], out[n, 1], out[n, 2], out[n, 3]
+        out[n + 1, 0] = q0*c - q1*p1 - q2*p2 - q3*p3
+        out[n + 1, 1] = q0*p1 + q1*c + q2*p3 - q3*p2
+        out[n + 1, 2] = q0*p2 - q1*p3 + q2*c + q3*p1
+        out[n + 1, 3] = q0*p3 + q1*p2 - q2*p1 + q3*c
+        out[n + 1, 4:7] = w_new
+        w[:] = w_new
+
+    return out
+
 
 class PrecisePointingSimulator:
     """Simulator for precise pointing control of Earth observation satellites"""
     
-    def __init__(self, spacecraft_params):
+    def __init__(self, spacecraft_params, seed=None, noise_step=1.0):
         self.spacecraft_params = spacecraft_params
-        self.inertia = np.array(spacecraft_params['inertia'])
+        self.inertia = np.array(spacecraft_params['inertia'], dtype=float)
+        self.inertia_inv = np.linalg.inv(self.inertia)
         self.mass = spacecraft_params['mass']
         
+        # Random disturbances are pre-sampled every noise_step seconds
+        self.noise_step = noise_step
+        self._rng = np.random.default_rng(seed)
+        self._noise = np.empty((0, 3))
+        
     def attitude_dynamics(self, t, state):
         """Attitude dynamics with disturbance torques"""
         # state: [q0, q1, q2, q3, wx, wy, wz]
-        q = state[0:4]
-        w = state[4:7]
-        
-        # Quaternion kinematics
-        q_dot = 0.5 * self.quaternion_kinematics(q, w)
-        
-        # Euler's equations for rigid body rotation
-        w_dot = np.linalg.inv(self.inertia) @ (
-            -np.cross(w, self.inertia @ w) + self.disturbance_torque(t)
-        )
-        
-        return np.concatenate([q_dot, w_dot])
+        return _attitude_rhs(state, self.inertia, self.inertia_inv,
+                             self.disturbance_torque(t))
     
-    def quaternion_kinematics(self, q, w):
+    def quaternion_kinematics(self, q, w, out=None):
         """Quaternion kinematic equations"""
-        q0, q1, q2, q3 = q
-        wx, wy, wz = w
-        
-        Omega = np.array([
-            [0, -wx, -wy, -wz],
-            [wx, 0, wz, -wy],
-            [wy, -wz, 0, wx],
-            [wz, wy, -wx, 0]
-        ])
-        
-        return 0.5 * Omega @ q
+        if out is None:
+            out = np.empty(4)
+        return _quaternion_rate(np.asarray(q, dtype=float),
+                                np.asarray(w, dtype=float), out)
     
     def disturbance_torque(self, t):
         """Simplified disturbance torque model"""
@@ -50,22 +157,94 @@ class PrecisePointingSimulator:
                                    0.05 * np.cos(0.1*t), 
                                    0.02 * np.sin(0.05*t)]) * 1e-5
         
-        # Other disturbances
-        other_disturbances = np.random.normal(0, 1e-6, 3)
+        # Other disturbances, interpolated between pre-sampled values so the
+        # torque is a deterministic function of t (the adaptive integrator
+        # re-evaluates the same t when it rejects a step)
+        s = max(t, 0.0) / self.noise_step
+        k = int(s)
+        self._sample_noise(k + 2)
+        frac = s - k
+        other_disturbances = (1.0 - frac) * self._noise[k] + frac * self._noise[k + 1]
         
         return gravity_gradient + other_disturbances
     
-    def simulate(self, duration, initial_state):
-        """Run the simulation"""
+    def _sample_noise(self, n_samples):
+        """Extend the disturbance noise table to at least n_samples rows"""
+        n_new = n_samples - len(self._noise)
+        if n_new > 0:
+            samples = self._rng.standard_normal((n_new, 3))
+            samples *= 1e-6
+            self._noise = np.vstack([self._noise, samples])
+    
+    def simulate(self, duration, initial_state, method='dopri5', dt=0.1,
+                 rtol=1e-8, atol=1e-10):
+        """
+        Run the simulation
+        
+        method='dopri5' (default) or 'dop853' calls the Fortran integrator
+        through scipy.integrate.ode, which has much less per-step overhead
+        than solve_ivp for a 7-state system. method='lie' uses a fixed-step
+        scheme (step dt) that keeps the attitude quaternion unit-norm; any
+        other value is passed to solve_ivp.
+        """
+        self._sample_noise(int(np.ceil(duration / self.noise_step)) + 2)
+        
+        if method == 'lie':
+            return self._simulate_lie_group(duration, initial_state, dt)
+        
+        t_eval = np.linspace(0, duration, 1000)
+        
+        if method in ('dopri5', 'dop853'):
+            return self._simulate_ode(t_eval, initial_state, method, rtol, atol)
+        
         sol = solve_ivp(
             self.attitude_dynamics,
             [0, duration],
             initial_state,
-            method='RK45',
-            t_eval=np.linspace(0, duration, 1000)
+            method=method,
+            t_eval=t_eval,
+            rtol=rtol,
+            atol=atol
         )
         
         return sol
+    
+    def _simulate_ode(self, t_eval, initial_state, method, rtol, atol):
+        """scipy.integrate.ode integration, returned in solve_ivp's format"""
+        solver = ode(self.attitude_dynamics)
+        solver.set_integrator(method, rtol=rtol, atol=atol)
+        solver.set_initial_value(initial_state, t_eval[0])
+        
+        states = np.empty((len(initial_state), len(t_eval)))
+        states[:, 0] = initial_state
+        n_done = 1
+        for k in range(1, len(t_eval)):
+            states[:, k] = solver.integrate(t_eval[k])
+            if not solver.successful():
+                break
+            n_done += 1
+        
+        success = solver.successful()
+        message = ("Integration completed." if success
+                   else f"Integration failed at t = {solver.t}.")
+        return OptimizeResult(t=t_eval[:n_done], y=states[:, :n_done],
+                              success=success, message=message)
+    
+    def _simulate_lie_group(self, duration, initial_state, dt):
+        """Fixed-step Lie-group integration, returned in solve_ivp's format"""
+        n_steps = int(np.ceil(duration / dt))
+        dt = duration / n_steps
+        
+        # Disturbance torque at every half step
+        t_half = np.linspace(0, duration, 2*n_steps + 1)
+        torques = np.array([self.disturbance_torque(t) for t in t_half])
+        
+        states = _lie_group_attitude(np.asarray(initial_state, dtype=float),
+                                     self.inertia, self.inertia_inv,
+                                     torques, dt, n_steps)
+        
+        return OptimizeResult(t=t_half[::2], y=states.T, success=True,
+                              message="Fixed-step integration completed.")
 
 if __name__ == "__main__":
     # Example usage
@@ -30,6 +30,26 @@ import numpy as np
 import matplotlib.pyplot as plt
 from scipy.integrate import solve_ivp
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; kernels then run as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, fastmath=True)
+def _axisymmetric_rhs(omega, I_t, I_s):
+    """Torque-free Euler equations for I = diag([I_t, I_t, I_s])."""
+    k = (I_t - I_s) / I_t
+    omega_dot = np.empty(3)
+    omega_dot[0] = k * omega[1] * omega[2]
+    omega_dot[1] = -k * omega[0] * omega[2]
+    omega_dot[2] = 0.0
+    return omega_dot
+
+
 class AxisymmetricSpacecraft:
     """
     Torque-free dynamics of axisymmetric rigid body.
@@ -38,7 +58,8 @@ class AxisymmetricSpacecraft:
     def __init__(self, I_transverse: float, I_spin: float):
         self.I_t = I_transverse
         self.I_s = I_spin
-        self.I = np.diag([I_transverse, I_transverse, I_spin])
+        self.I_diag = np.array([I_transverse, I_transverse, I_spin], dtype=float)
+        self.I = np.diag(self.I_diag)
         self.I_inv = np.linalg.inv(self.I)
         
         # Classification
@@ -68,12 +89,14 @@ class AxisymmetricSpacecraft:
         # Time vector
         t = np.linspace(t_span[0], t_span[1], n_points)
         
-        # Analytical solution
-        omega1 = A * np.cos(Omega * t + phi_0)
-        omega2 = A * np.sin(Omega * t + phi_0)
-        omega3 = omega3_0 * np.ones_like(t)
-        
-        omega = np.column_stack([omega1, omega2, omega3])
+        # Analytical solution, written column by column into one buffer
+        phase = Omega * t + phi_0
+        omega = np.empty((n_points, 3))
+        np.cos(phase, out=omega[:, 0])
+        omega[:, 0] *= A
+        np.sin(phase, out=omega[:, 1])
+        omega[:, 1] *= A
+        omega[:, 2] = omega3_0
         
         # Compute conserved quantities
         h = self.angular_momentum(omega0)
@@ -94,27 +117,22 @@ class AxisymmetricSpacecraft:
     
     def euler_equations(self, t: float, state: np.ndarray) -> np.ndarray:
         """Euler's equations for torque-free motion."""
-        omega = state
-        gyro = np.cross(omega, self.I @ omega)
-        omega_dot = self.I_inv @ (-gyro)
-        return omega_dot
+        return _axisymmetric_rhs(state, self.I_t, self.I_s)
     
     def angular_momentum(self, omega: np.ndarray) -> np.ndarray:
         """Calculate angular momentum h = I⋅ω"""
-        if omega.ndim == 1:
-            return self.I @ omega
-        else:
-            return (self.I @ omega.T).T
+        # I is diagonal, so I⋅ω broadcasts over single vectors and time histories
+        return omega * self.I_diag
     
     def kinetic_energy(self, omega: np.ndarray) -> float:
         """Calculate kinetic energy T = 0.5 * ωᵀ I ω"""
         if omega.ndim == 1:
-            return 0.5 * omega.T @ self.I @ omega
+            return 0.5 * np.dot(omega * omega, self.I_diag)
         else:
             # For array of omega values - calculate energy for each time step
-            return 0.5 * np.sum(omega @ self.I * omega, axis=1)
+            return 0.5 * np.einsum('ij,j,ij->i', omega, self.I_diag, omega)
 
-def plot_results(analytical: dict):
+def plot_results(analytical: dict, spacecraft: AxisymmetricSpacecraft):
     """Create visualization of results."""
     fig, axes = plt.subplots(2, 2, figsize=(12, 10))
     
@@ -139,7 +157,6 @@ def plot_results(analytical: dict):
     axes[0,1].legend()
     
     # Energy conservation
-    spacecraft = AxisymmetricSpacecraft(100, 50)
     T = spacecraft.kinetic_energy(analytical['omega'])
     T_error = 100 * (T - analytical['kinetic_energy']) / analytical['kinetic_energy']
     axes[1,0].plot(analytical['t'], T_error, 'r-')
@@ -180,7 +197,7 @@ def main():
     analytical = spacecraft.analytical_solution(omega0, t_span=(0, 20), n_points=1000)
     
     print("\n[3/3] Generating visualizations...")
-    plot_results(analytical)
+    plot_results(analytical, spacecraft)
     
     # Print results
     print("\n" + "=" * 60)
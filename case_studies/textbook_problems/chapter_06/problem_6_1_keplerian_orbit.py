@@ -36,11 +36,27 @@ SOLUTION APPROACH:
 6. Create 3D visualization
 """
 
+from math import cos, cosh, pi, radians, sin, sinh, sqrt
+
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.integrate import solve_ivp
+from scipy.integrate import ode, solve_ivp
 from mpl_toolkits.mplot3d import Axes3D
 
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; kernels then run as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+    prange = range
+
+try:
+    from numba import cuda
+except ImportError:
+    cuda = None
+
 
 # ==============================================================================
 # SECTION 1: PROBLEM PARAMETERS
@@ -75,6 +91,81 @@ def define_parameters():
 # SECTION 2: ANALYTICAL SOLUTION
 # ==============================================================================
 
+@njit(cache=True)
+def _cartesian_to_orbital(rx, ry, rz, vx, vy, vz, mu):
+    """
+    Classical orbital elements from a Cartesian state, on plain scalars.
+    
+    Returns:
+        Tuple (a, e, i, raan, argp, nu, h_mag, energy, T), angles in radians
+    """
+    # Angular momentum vector h = r x v
+    hx = ry*vz - rz*vy
+    hy = rz*vx - rx*vz
+    hz = rx*vy - ry*vx
+    h_mag = sqrt(hx*hx + hy*hy + hz*hz)
+    
+    # Eccentricity vector
+    r_mag = sqrt(rx*rx + ry*ry + rz*rz)
+    v_mag2 = vx*vx + vy*vy + vz*vz
+    rv = rx*vx + ry*vy + rz*vz
+    c = v_mag2 - mu/r_mag
+    ex = (c*rx - rv*vx) / mu
+    ey = (c*ry - rv*vy) / mu
+    ez = (c*rz - rv*vz) / mu
+    e = sqrt(ex*ex + ey*ey + ez*ez)
+    
+    # Energy and semi-major axis
+    energy = v_mag2/2 - mu/r_mag
+    if abs(energy) < 1e-10:
+        a = np.inf  # Parabolic orbit
+    else:
+        a = -mu / (2 * energy)
+    
+    # Orbital period
+    if a > 0 and not np.isinf(a):
+        T = 2 * np.pi * sqrt(a**3 / mu)
+    else:
+        T = np.inf
+    
+    # Rectilinear motion (r parallel to v): the orbital plane is undefined
+    if h_mag < 1e-12 * r_mag * sqrt(v_mag2):
+        return a, e, np.nan, np.nan, np.nan, np.nan, h_mag, energy, T
+    
+    # Cosines are clipped to [-1, 1]: rounding can push them just outside
+    
+    # Inclination
+    i = np.arccos(min(1.0, max(-1.0, hz / h_mag)))
+    
+    # Right Ascension of Ascending Node (RAAN), node vector n = z x h
+    nx, ny = -hy, hx
+    n_mag = sqrt(nx*nx + ny*ny)
+    if n_mag == 0:
+        raan = 0.0  # Equatorial orbit
+    else:
+        raan = np.arccos(min(1.0, max(-1.0, nx / n_mag)))
+        if ny < 0:
+            raan = 2 * np.pi - raan
+    
+    # Argument of perigee
+    if n_mag == 0 or e < 1e-10:
+        argp = 0.0  # Circular or equatorial orbit
+    else:
+        argp = np.arccos(min(1.0, max(-1.0, (nx*ex + ny*ey) / (n_mag * e))))
+        if ez < 0:
+            argp = 2 * np.pi - argp
+    
+    # True anomaly
+    if e < 1e-10:
+        nu = 0.0  # Circular orbit
+    else:
+        nu = np.arccos(min(1.0, max(-1.0, (ex*rx + ey*ry + ez*rz) / (e * r_mag))))
+        if rv < 0:
+            nu = 2 * np.pi - nu
+    
+    return a, e, i, raan, argp, nu, h_mag, energy, T
+
+
 class OrbitalElements:
     """
     Class for orbital elements calculations.
@@ -93,57 +184,9 @@ class OrbitalElements:
         Returns:
             Dictionary with orbital elements
         """
-        # Angular momentum vector
-        h = np.cross(r, v)
-        h_mag = np.linalg.norm(h)
-        
-        # Eccentricity vector
-        r_mag = np.linalg.norm(r)
-        v_mag = np.linalg.norm(v)
-        e_vec = ((v_mag**2 - mu/r_mag) * r - np.dot(r, v) * v) / mu
-        e = np.linalg.norm(e_vec)
-        
-        # Energy and semi-major axis
-        energy = v_mag**2/2 - mu/r_mag
-        if abs(energy) < 1e-10:
-            a = float('inf')  # Parabolic orbit
-        else:
-            a = -mu / (2 * energy)
-        
-        # Inclination
-        i = np.arccos(h[2] / h_mag)
-        
-        # Right Ascension of Ascending Node (RAAN)
-        n = np.cross([0, 0, 1], h)  # Node vector
-        n_mag = np.linalg.norm(n)
-        if n_mag == 0:
-            raan = 0.0  # Equatorial orbit
-        else:
-            raan = np.arccos(n[0] / n_mag)
-            if n[1] < 0:
-                raan = 2 * np.pi - raan
-        
-        # Argument of perigee
-        if n_mag == 0 or e < 1e-10:
-            argp = 0.0  # Circular or equatorial orbit
-        else:
-            argp = np.arccos(np.dot(n, e_vec) / (n_mag * e))
-            if e_vec[2] < 0:
-                argp = 2 * np.pi - argp
-        
-        # True anomaly
-        if e < 1e-10:
-            nu = 0.0  # Circular orbit
-        else:
-            nu = np.arccos(np.dot(e_vec, r) / (e * r_mag))
-            if np.dot(r, v) < 0:
-                nu = 2 * np.pi - nu
-        
-        # Orbital period
-        if a > 0 and not np.isinf(a):
-            T = 2 * np.pi * np.sqrt(a**3 / mu)
-        else:
-            T = float('inf')
+        a, e, i, raan, argp, nu, h_mag, energy, T = _cartesian_to_orbital(
+            float(r[0]), float(r[1]), float(r[2]),
+            float(v[0]), float(v[1]), float(v[2]), float(mu))
         
         return {
             'semi_major_axis': a,
@@ -191,56 +234,233 @@ class OrbitalElements:
         Returns:
             Tuple (r, v) position and velocity vectors
         """
-        # Convert to radians
-        i = np.radians(elements['inclination'])
-        raan = np.radians(elements['raan'])
-        argp = np.radians(elements['argument_perigee'])
-        nu = np.radians(elements['true_anomaly'])
+        # Scalar trig from math; angles converted to radians
+        i = radians(elements['inclination'])
+        raan = radians(elements['raan'])
+        argp = radians(elements['argument_perigee'])
+        nu = radians(elements['true_anomaly'])
         
         a = elements['semi_major_axis']
         e = elements['eccentricity']
         
+        cos_nu, sin_nu = cos(nu), sin(nu)
+        cos_raan, sin_raan = cos(raan), sin(raan)
+        cos_i, sin_i = cos(i), sin(i)
+        cos_w, sin_w = cos(argp), sin(argp)
+        
         # Semi-latus rectum
         p = a * (1 - e**2)
         
-        # Position in perifocal frame
-        r_peri = p / (1 + e * np.cos(nu))
-        r_pf = np.array([
-            r_peri * np.cos(nu),
-            r_peri * np.sin(nu),
-            0
-        ])
-        
-        # Velocity in perifocal frame
-        v_pf = np.array([
-            -np.sqrt(mu/p) * np.sin(nu),
-            np.sqrt(mu/p) * (e + np.cos(nu)),
-            0
-        ])
+        # Position and velocity in perifocal frame (z components are zero)
+        r_peri = p / (1 + e * cos_nu)
+        rx, ry = r_peri * cos_nu, r_peri * sin_nu
+        k = sqrt(mu / p)
+        vx, vy = -k * sin_nu, k * (e + cos_nu)
         
-        # Rotation matrix from perifocal to ECI
-        R = OrbitalElements._perifocal_to_eci_matrix(i, raan, argp)
+        # First two columns of the perifocal-to-ECI rotation
+        R00 = cos_raan*cos_w - sin_raan*sin_w*cos_i
+        R01 = -cos_raan*sin_w - sin_raan*cos_w*cos_i
+        R10 = sin_raan*cos_w + cos_raan*sin_w*cos_i
+        R11 = -sin_raan*sin_w + cos_raan*cos_w*cos_i
+        R20 = sin_w*sin_i
+        R21 = cos_w*sin_i
         
         # Transform to ECI
-        r_eci = R @ r_pf
-        v_eci = R @ v_pf
+        r_eci = np.array([R00*rx + R01*ry, R10*rx + R11*ry, R20*rx + R21*ry])
+        v_eci = np.array([R00*vx + R01*vy, R10*vx + R11*vy, R20*vx + R21*vy])
         
         return r_eci, v_eci
     
     @staticmethod
-    def _perifocal_to_eci_matrix(i: float, raan: float, argp: float) -> np.ndarray:
+    def propagate_true_anomaly(elements: dict, nu: np.ndarray, mu: float) -> tuple:
         """
-        Rotation matrix from perifocal to ECI frame.
+        Positions and velocities along one orbit at many true anomalies.
+        
+        The perifocal-to-ECI rotation depends only on i, RAAN and argument
+        of perigee, so it is built once and applied to all samples.
+        
+        Args:
+            elements: Orbital elements (true_anomaly entry is ignored)
+            nu: True anomalies, shape (N,) [deg]
+            mu: Gravitational parameter
+            
+        Returns:
+            Tuple (r, v) of arrays with shape (N, 3)
+        """
+        R = OrbitalElements._perifocal_to_eci_matrix(
+            radians(elements['inclination']),
+            radians(elements['raan']),
+            radians(elements['argument_perigee']))
+        
+        a = elements['semi_major_axis']
+        e = elements['eccentricity']
+        p = a * (1 - e**2)
+        
+        nu = np.radians(nu)
+        cos_nu, sin_nu = np.cos(nu), np.sin(nu)
+        
+        # Perifocal position and velocity; the z components are zero, so
+        # only the first two columns of R are needed
+        r_peri = p / (1 + e * cos_nu)
+        r_pf = np.column_stack([r_peri * cos_nu, r_peri * sin_nu])
+        k = sqrt(mu / p)
+        v_pf = np.column_stack([-k * sin_nu, k * (e + cos_nu)])
+        
+        return r_pf @ R[:, :2].T, v_pf @ R[:, :2].T
+    
+    @staticmethod
+    def cartesian_to_orbital_batch(r: np.ndarray, v: np.ndarray, mu: float,
+                                   dtype=np.float64) -> dict:
+        """
+        Convert many Cartesian states to classical orbital elements at once.
+        
+        Args:
+            r: Position vectors, shape (N, 3) [km]
+            v: Velocity vectors, shape (N, 3) [km/s]
+            mu: Gravitational parameter [km³/s²]
+            dtype: Floating type of all arrays; np.float32 halves memory
+                   traffic for large ensembles at ~7 significant digits
+            
+        Returns:
+            Dictionary with the same keys as cartesian_to_orbital, each
+            holding an array of length N
         """
+        r = np.asarray(r, dtype=dtype)
+        v = np.asarray(v, dtype=dtype)
+        mu = np.dtype(dtype).type(mu)
+        
+        h = np.cross(r, v)
+        h_mag = np.sqrt(np.einsum('ij,ij->i', h, h))
+        
+        r_mag = np.sqrt(np.einsum('ij,ij->i', r, r))
+        v_mag2 = np.einsum('ij,ij->i', v, v)
+        rv = np.einsum('ij,ij->i', r, v)
+        e_vec = ((v_mag2 - mu/r_mag)[:, None] * r - rv[:, None] * v) / mu
+        e = np.sqrt(np.einsum('ij,ij->i', e_vec, e_vec))
+        
+        energy = v_mag2/2 - mu/r_mag
+        
+        # Degenerate cases (parabolic, equatorial, circular) are masked
+        # after the fact, so silence the divisions they trigger
+        with np.errstate(divide='ignore', invalid='ignore'):
+            a = np.where(np.abs(energy) < 1e-10, np.inf, -mu / (2 * energy))
+            
+            # Cosines are clipped: rounding can push them just past +-1
+            i = np.arccos(np.clip(h[:, 2] / h_mag, -1.0, 1.0))
+            
+            nx, ny = -h[:, 1], h[:, 0]
+            n_mag = np.hypot(nx, ny)
+            equatorial = n_mag == 0
+            circular = e < 1e-10
+            
+            raan = np.arccos(np.clip(nx / n_mag, -1.0, 1.0))
+            raan = np.where(ny < 0, 2 * np.pi - raan, raan)
+            raan = np.where(equatorial, 0.0, raan)
+            
+            argp = np.arccos(np.clip((nx*e_vec[:, 0] + ny*e_vec[:, 1]) / (n_mag * e),
+                                     -1.0, 1.0))
+            argp = np.where(e_vec[:, 2] < 0, 2 * np.pi - argp, argp)
+            argp = np.where(equatorial | circular, 0.0, argp)
+            
+            nu = np.arccos(np.clip(np.einsum('ij,ij->i', e_vec, r) / (e * r_mag),
+                                   -1.0, 1.0))
+            nu = np.where(rv < 0, 2 * np.pi - nu, nu)
+            nu = np.where(circular, 0.0, nu)
+            
+            # Rectilinear motion (r parallel to v): orbital plane undefined
+            rectilinear = h_mag < 1e-12 * r_mag * np.sqrt(v_mag2)
+            i, raan, argp, nu = (np.where(rectilinear, np.nan, angle)
+                                 for angle in (i, raan, argp, nu))
+            
+            T = np.where((a > 0) & np.isfinite(a),
+                         2 * np.pi * np.sqrt(a**3 / mu), np.inf)
+        
+        return {
+            'semi_major_axis': a,
+            'eccentricity': e,
+            'inclination': np.degrees(i),
+            'raan': np.degrees(raan),
+            'argument_perigee': np.degrees(argp),
+            'true_anomaly': np.degrees(nu),
+            'angular_momentum': h_mag,
+            'energy': energy,
+            'period': T
+        }
+    
+    @staticmethod
+    def orbital_to_cartesian_batch(elements: dict, mu: float,
+                                   dtype=np.float64) -> tuple:
+        """
+        Convert many sets of orbital elements to Cartesian coordinates.
+        
+        Args:
+            elements: Orbital elements, each entry an array of length N
+            mu: Gravitational parameter
+            dtype: Floating type of all arrays (see cartesian_to_orbital_batch)
+            
+        Returns:
+            Tuple (r, v) of arrays with shape (N, 3)
+        """
+        i = np.radians(np.asarray(elements['inclination'], dtype=dtype))
+        raan = np.radians(np.asarray(elements['raan'], dtype=dtype))
+        argp = np.radians(np.asarray(elements['argument_perigee'], dtype=dtype))
+        nu = np.radians(np.asarray(elements['true_anomaly'], dtype=dtype))
+        
+        a = np.asarray(elements['semi_major_axis'], dtype=dtype)
+        e = np.asarray(elements['eccentricity'], dtype=dtype)
+        mu = np.dtype(dtype).type(mu)
+        
+        cos_nu, sin_nu = np.cos(nu), np.sin(nu)
         cos_raan, sin_raan = np.cos(raan), np.sin(raan)
         cos_i, sin_i = np.cos(i), np.sin(i)
         cos_w, sin_w = np.cos(argp), np.sin(argp)
         
-        R = np.array([
-            [cos_raan*cos_w - sin_raan*sin_w*cos_i, -cos_raan*sin_w - sin_raan*cos_w*cos_i, sin_raan*sin_i],
-            [sin_raan*cos_w + cos_raan*sin_w*cos_i, -sin_raan*sin_w + cos_raan*cos_w*cos_i, -cos_raan*sin_i],
-            [sin_w*sin_i, cos_w*sin_i, cos_i]
-        ])
+        # Position and velocity in perifocal frame
+        p = a * (1 - e**2)
+        r_peri = p / (1 + e * cos_nu)
+        rx, ry = r_peri * cos_nu, r_peri * sin_nu
+        k = np.sqrt(mu / p)
+        vx, vy = -k * sin_nu, k * (e + cos_nu)
+        
+        # First two columns of the perifocal-to-ECI rotation
+        R00 = cos_raan*cos_w - sin_raan*sin_w*cos_i
+        R01 = -cos_raan*sin_w - sin_raan*cos_w*cos_i
+        R10 = sin_raan*cos_w + cos_raan*sin_w*cos_i
+        R11 = -sin_raan*sin_w + cos_raan*cos_w*cos_i
+        R20 = sin_w*sin_i
+        R21 = cos_w*sin_i
+        
+        r_eci = np.column_stack([R00*rx + R01*ry, R10*rx + R11*ry, R20*rx + R21*ry])
+        v_eci = np.column_stack([R00*vx + R01*vy, R10*vx + R11*vy, R20*vx + R21*vy])
+        
+        return r_eci, v_eci
+    
+    @staticmethod
+    def _perifocal_to_eci_matrix(i: float, raan: float, argp: float,
+                                 out: np.ndarray = None) -> np.ndarray:
+        """
+        Rotation matrix from perifocal to ECI frame.
+        
+        Args:
+            i, raan, argp: Inclination, RAAN and argument of perigee [rad]
+            out: Optional 3x3 buffer to fill, reused across calls
+        """
+        # Scalar trig from math avoids NumPy's ufunc dispatch on plain floats
+        cos_raan, sin_raan = cos(raan), sin(raan)
+        cos_i, sin_i = cos(i), sin(i)
+        cos_w, sin_w = cos(argp), sin(argp)
+        
+        # Fill element by element rather than parsing nested lists
+        R = np.empty((3, 3)) if out is None else out
+        R[0, 0] = cos_raan*cos_w - sin_raan*sin_w*cos_i
+        R[0, 1] = -cos_raan*sin_w - sin_raan*cos_w*cos_i
+        R[0, 2] = sin_raan*sin_i
+        R[1, 0] = sin_raan*cos_w + cos_raan*sin_w*cos_i
+        R[1, 1] = -sin_raan*sin_w + cos_raan*cos_w*cos_i
+        R[1, 2] = -cos_raan*sin_i
+        R[2, 0] = sin_w*sin_i
+        R[2, 1] = cos_w*sin_i
+        R[2, 2] = cos_i
         
         return R
 
@@ -249,6 +469,221 @@ class OrbitalElements:
 # SECTION 3: NUMERICAL SOLUTION
 # ==============================================================================
 
+@njit(cache=True, fastmath=True)
+def _two_body_rhs(state, mu):
+    """
+    Two-body state derivative [velocity, acceleration].
+    """
+    rx, ry, rz = state[0], state[1], state[2]
+    r2 = rx*rx + ry*ry + rz*rz
+    k = -mu / (r2 * np.sqrt(r2))
+    
+    # A fresh array per call: solve_ivp keeps a reference to the last
+    # derivative across steps, so a reused buffer would be overwritten
+    state_dot = np.empty(6)
+    state_dot[0] = state[3]
+    state_dot[1] = state[4]
+    state_dot[2] = state[5]
+    state_dot[3] = k * rx
+    state_dot[4] = k * ry
+    state_dot[5] = k * rz
+    
+    return state_dot
+
+
+@njit(cache=True, fastmath=True)
+def _two_body_jac(state, mu):
+    """
+    Jacobian of the two-body state derivative.
+    
+    The only non-trivial block is the gravity gradient
+    mu * (3 r rᵀ / r⁵ - I / r³) coupling position to acceleration.
+    """
+    rx, ry, rz = state[0], state[1], state[2]
+    r2 = rx*rx + ry*ry + rz*rz
+    r3 = r2 * np.sqrt(r2)
+    k3 = mu / r3
+    k5 = 3.0 * k3 / r2
+    
+    jac = np.zeros((6, 6))
+    jac[0, 3] = 1.0
+    jac[1, 4] = 1.0
+    jac[2, 5] = 1.0
+    
+    jac[3, 0] = k5*rx*rx - k3
+    jac[3, 1] = k5*rx*ry
+    jac[3, 2] = k5*rx*rz
+    jac[4, 0] = jac[3, 1]
+    jac[4, 1] = k5*ry*ry - k3
+    jac[4, 2] = k5*ry*rz
+    jac[5, 0] = jac[3, 2]
+    jac[5, 1] = jac[4, 2]
+    jac[5, 2] = k5*rz*rz - k3
+    
+    return jac
+
+
+# Substep weights of the symplectic compositions: plain velocity Verlet
+# (2nd order) and Yoshida's triple-jump composition of it (4th order)
+_CBRT2 = 2.0 ** (1.0 / 3.0)
+SYMPLECTIC_METHODS = {
+    'verlet': np.array([1.0]),
+    'yoshida4': np.array([1.0, -_CBRT2, 1.0]) / (2.0 - _CBRT2),
+}
+
+
+@njit(cache=True, fastmath=True)
+def _symplectic_two_body(state0, mu, dt, n_steps, weights, out):
+    """
+    Fixed-step symplectic two-body propagation into out[:n_steps + 1].
+    
+    Each step applies one kick-drift-kick velocity-Verlet substep of
+    length w*dt per entry of weights. Energy error stays bounded instead
+    of drifting, so large steps remain usable over long horizons.
+    """
+    rx, ry, rz = state0[0], state0[1], state0[2]
+    vx, vy, vz = state0[3], state0[4], state0[5]
+    
+    r2 = rx*rx + ry*ry + rz*rz
+    k = -mu / (r2 * sqrt(r2))
+    ax, ay, az = k*rx, k*ry, k*rz
+    
+    out[0, 0], out[0, 1], out[0, 2] = rx, ry, rz
+    out[0, 3], out[0, 4], out[0, 5] = vx, vy, vz
+    
+    for n in range(1, n_steps + 1):
+        for m in range(weights.shape[0]):
+            h = weights[m] * dt
+            vx += 0.5*h*ax
+            vy += 0.5*h*ay
+            vz += 0.5*h*az
+            rx += h*vx
+            ry += h*vy
+            rz += h*vz
+            r2 = rx*rx + ry*ry + rz*rz
+            k = -mu / (r2 * sqrt(r2))
+            ax, ay, az = k*rx, k*ry, k*rz
+            vx += 0.5*h*ax
+            vy += 0.5*h*ay
+            vz += 0.5*h*az
+        
+        out[n, 0], out[n, 1], out[n, 2] = rx, ry, rz
+        out[n, 3], out[n, 4], out[n, 5] = vx, vy, vz
+    
+    return out
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _symplectic_two_body_batch(states0, mu, dt, n_steps, weights):
+    """
+    Propagate independent trajectories in parallel, one per row of states0.
+    """
+    n_traj = states0.shape[0]
+    out = np.empty((n_traj, n_steps + 1, 6))
+    for j in prange(n_traj):
+        _symplectic_two_body(states0[j], mu, dt, n_steps, weights, out[j])
+    return out
+
+
+if cuda is not None:
+    # The CPU kernel uses only scalar math and indexing, so the same source
+    # compiles as a CUDA device function with the state held in registers
+    _symplectic_two_body_device = cuda.jit(device=True)(
+        getattr(_symplectic_two_body, 'py_func', _symplectic_two_body))
+    
+    @cuda.jit
+    def _symplectic_two_body_cuda(states0, mu, dt, n_steps, weights, out):
+        """
+        One GPU thread per trajectory.
+        """
+        j = cuda.grid(1)
+        if j < states0.shape[0]:
+            _symplectic_two_body_device(states0[j], mu, dt, n_steps, weights, out[j])
+
+
+@njit(cache=True)
+def _stumpff(z):
+    """
+    Stumpff functions C(z), S(z) of the universal-variable formulation.
+    """
+    if z > 1e-3:
+        sz = sqrt(z)
+        return (1.0 - cos(sz)) / z, (sz - sin(sz)) / (z * sz)
+    if z < -1e-3:
+        sz = sqrt(-z)
+        return (cosh(sz) - 1.0) / (-z), (sinh(sz) - sz) / (-z * sz)
+    # Series expansion, avoids cancellation near z = 0
+    return (0.5 - z/24.0 + z*z/720.0 - z*z*z/40320.0,
+            1.0/6.0 - z/120.0 + z*z/5040.0 - z*z*z/362880.0)
+
+
+@njit(cache=True)
+def _kepler_universal(state0, mu, t, out):
+    """
+    Analytic two-body propagation with universal variables.
+    
+    Each output time solves the universal Kepler equation by Newton
+    iteration and maps the initial state through the Lagrange f and g
+    coefficients, so there is no error accumulation between samples.
+    Valid for elliptic, parabolic and hyperbolic orbits.
+    """
+    rx0, ry0, rz0 = state0[0], state0[1], state0[2]
+    vx0, vy0, vz0 = state0[3], state0[4], state0[5]
+    r0 = sqrt(rx0*rx0 + ry0*ry0 + rz0*rz0)
+    v02 = vx0*vx0 + vy0*vy0 + vz0*vz0
+    vr0 = (rx0*vx0 + ry0*vy0 + rz0*vz0) / r0
+    sqrt_mu = sqrt(mu)
+    alpha = 2.0/r0 - v02/mu  # reciprocal of the semi-major axis
+    
+    # Bound orbits repeat every period; reduce dt to keep z small
+    period = 2.0*pi / (sqrt(mu) * alpha**1.5) if alpha > 0.0 else 0.0
+    
+    for k in range(t.shape[0]):
+        dt = t[k] - t[0]
+        if period > 0.0:
+            dt = dt % period
+        
+        # Newton iteration on the universal anomaly chi
+        chi = sqrt_mu * abs(alpha) * dt
+        for _ in range(50):
+            z = alpha * chi * chi
+            C, S = _stumpff(z)
+            F = (r0*vr0/sqrt_mu * chi*chi*C + (1.0 - alpha*r0) * chi*chi*chi*S
+                 + r0*chi - sqrt_mu*dt)
+            dF = (r0*vr0/sqrt_mu * chi * (1.0 - z*S)
+                  + (1.0 - alpha*r0) * chi*chi*C + r0)
+            step = F / dF
+            chi -= step
+            if abs(step) <= 1e-12 * (1.0 + abs(chi)):
+                break
+        
+        z = alpha * chi * chi
+        C, S = _stumpff(z)
+        f = 1.0 - chi*chi/r0 * C
+        g = dt - chi*chi*chi/sqrt_mu * S
+        
+        rx = f*rx0 + g*vx0
+        ry = f*ry0 + g*vy0
+        rz = f*rz0 + g*vz0
+        r = sqrt(rx*rx + ry*ry + rz*rz)
+        
+        f_dot = sqrt_mu / (r*r0) * (z*chi*S - chi)
+        g_dot = 1.0 - chi*chi/r * C
+        
+        out[k, 0] = rx
+        out[k, 1] = ry
+        out[k, 2] = rz
+        out[k, 3] = f_dot*rx0 + g_dot*vx0
+        out[k, 4] = f_dot*ry0 + g_dot*vy0
+        out[k, 5] = f_dot*rz0 + g_dot*vz0
+    
+    return out
+
+
+# Integrators of scipy.integrate.ode accepted by OrbitPropagator.propagate
+ODE_METHODS = ('dopri5', 'dop853', 'lsoda')
+
+
 class OrbitPropagator:
     """
     Numerical orbit propagator using two-body dynamics.
@@ -275,36 +710,67 @@ class OrbitPropagator:
         Returns:
             State derivative
         """
-        r = state[:3]
-        r_mag = np.linalg.norm(r)
-        
-        # Acceleration due to gravity
-        a = -self.mu * r / r_mag**3
-        
-        # State derivative [velocity, acceleration]
-        state_dot = np.concatenate([state[3:6], a])
+        return _two_body_rhs(state, self.mu)
+    
+    def two_body_jacobian(self, t, state):
+        """
+        Analytic Jacobian of the two-body equations.
         
-        return state_dot
+        Args:
+            t: Time
+            state: [x, y, z, vx, vy, vz]
+            
+        Returns:
+            6x6 Jacobian matrix
+        """
+        return _two_body_jac(state, self.mu)
     
-    def propagate(self):
+    def propagate(self, method='dopri5', rtol=1e-10, atol=1e-12):
         """
         Propagate orbit numerically.
         
+        Args:
+            method: 'dopri5' / 'dop853' / 'lsoda' (Fortran integrators of
+                    scipy.integrate.ode, sampled every params['dt']; lsoda
+                    is faster but drifts further from the analytic orbit
+                    at the same tolerances), one of
+                    the fixed-step symplectic schemes 'verlet' / 'yoshida4'
+                    (step params['dt']), 'kepler' for the analytic solution
+                    on the same grid, or any solve_ivp method
+            rtol: Relative tolerance
+            atol: Absolute tolerance
+            
         Returns:
             Dictionary with solution
         """
+        if method in SYMPLECTIC_METHODS:
+            return self._propagate_symplectic(SYMPLECTIC_METHODS[method])
+        if method in ODE_METHODS:
+            return self._propagate_ode(method, rtol, atol)
+        if method == 'kepler':
+            return self._propagate_kepler()
+        
+        # Only the implicit methods make use of the Jacobian
+        options = {}
+        if method in ('Radau', 'BDF', 'LSODA'):
+            options['jac'] = self.two_body_jacobian
+        
         # Initial state [position, velocity]
         state0 = np.concatenate([self.params['r0'], self.params['v0']])
         t_span = (self.params['t_start'], self.params['t_end'])
+        t_eval, _ = self._fixed_step_grid()
         
-        # Integrate
+        # Integrate, reporting only the requested output times
         sol = solve_ivp(
             self.two_body_equations,
             t_span,
             state0,
-            method='RK45',
-            dense_output=True,
-            max_step=self.params['dt']
+            method=method,
+            t_eval=t_eval,
+            max_step=self.params['dt'],
+            rtol=rtol,
+            atol=atol,
+            **options
         )
         
         # Extract position and velocity
@@ -319,12 +785,199 @@ class OrbitPropagator:
         }
         
         return results
+    
+    def _propagate_ode(self, method, rtol, atol):
+        """
+        Propagate orbit with scipy.integrate.ode.
+        
+        For a 6-state system the per-step Python overhead of solve_ivp
+        dominates; ode drives the Fortran integrators directly.
+        
+        Args:
+            method: Integrator name from ODE_METHODS
+            rtol: Relative tolerance
+            atol: Absolute tolerance
+            
+        Returns:
+            Dictionary with solution
+        """
+        state0 = np.concatenate([self.params['r0'], self.params['v0']]).astype(float)
+        t, _ = self._fixed_step_grid()
+        
+        # The Jacobian is only used by lsoda
+        solver = ode(self.two_body_equations, self.two_body_jacobian)
+        solver.set_integrator(method, rtol=rtol, atol=atol)
+        solver.set_initial_value(state0, t[0])
+        
+        states = np.empty((len(t), 6))
+        states[0] = state0
+        n_done = 1
+        for k in range(1, len(t)):
+            states[k] = solver.integrate(t[k])
+            if not solver.successful():
+                break
+            n_done += 1
+        
+        results = {
+            't': t[:n_done],
+            'position': states[:n_done, :3],
+            'velocity': states[:n_done, 3:],
+            'success': solver.successful()
+        }
+        
+        return results
+    
+    def _propagate_kepler(self):
+        """
+        Propagate orbit analytically by solving Kepler's equation.
+        
+        Returns:
+            Dictionary with solution
+        """
+        state0 = np.concatenate([self.params['r0'], self.params['v0']]).astype(float)
+        t, _ = self._fixed_step_grid()
+        
+        states = _kepler_universal(state0, self.mu, t, np.empty((len(t), 6)))
+        
+        results = {
+            't': t,
+            'position': states[:, :3],
+            'velocity': states[:, 3:],
+            'success': True
+        }
+        
+        return results
+    
+    def _propagate_symplectic(self, weights):
+        """
+        Propagate orbit with a fixed-step symplectic integrator.
+        
+        Args:
+            weights: Substep weights from SYMPLECTIC_METHODS
+            
+        Returns:
+            Dictionary with solution
+        """
+        state0 = np.concatenate([self.params['r0'], self.params['v0']]).astype(float)
+        t, dt = self._fixed_step_grid()
+        
+        states = np.empty((len(t), 6))
+        _symplectic_two_body(state0, self.mu, dt, len(t) - 1, weights, states)
+        
+        results = {
+            't': t,
+            'position': states[:, :3],
+            'velocity': states[:, 3:],
+            'success': True
+        }
+        
+        return results
+    
+    def propagate_batch(self, r0, v0, method='yoshida4', target='cpu'):
+        """
+        Propagate many initial conditions at once (Monte Carlo, sweeps).
+        
+        Trajectories are independent, so they are distributed across
+        threads with no synchronization.
+        
+        Args:
+            r0: Initial positions, shape (N, 3) [km]
+            v0: Initial velocities, shape (N, 3) [km/s]
+            method: Symplectic scheme from SYMPLECTIC_METHODS
+            target: 'cpu' (multi-threaded) or 'cuda' (requires a CUDA GPU)
+            
+        Returns:
+            Dictionary with solution; position/velocity have shape (N, n_t, 3)
+        """
+        states0 = np.ascontiguousarray(np.hstack([r0, v0]), dtype=float)
+        t, dt = self._fixed_step_grid()
+        weights = SYMPLECTIC_METHODS[method]
+        
+        if target == 'cuda':
+            states = self._propagate_batch_cuda(states0, dt, len(t) - 1, weights)
+        elif target == 'cpu':
+            states = _symplectic_two_body_batch(states0, self.mu, dt, len(t) - 1,
+                                                weights)
+        else:
+            raise ValueError("target must be 'cpu' or 'cuda'")
+        
+        results = {
+            't': t,
+            'position': states[:, :, :3],
+            'velocity': states[:, :, 3:],
+            'success': True
+        }
+        
+        return results
+    
+    def _propagate_batch_cuda(self, states0, dt, n_steps, weights):
+        """
+        Run the batch kernel on the GPU, 256 threads per block.
+        
+        Returns:
+            Array of states, shape (N, n_steps + 1, 6)
+        """
+        if cuda is None or not cuda.is_available():
+            raise RuntimeError("CUDA target requested but no CUDA device is available")
+        
+        n_traj = states0.shape[0]
+        out = cuda.device_array((n_traj, n_steps + 1, 6))
+        threads = 256
+        blocks = (n_traj + threads - 1) // threads
+        _symplectic_two_body_cuda[blocks, threads](
+            cuda.to_device(states0), self.mu, dt, n_steps,
+            cuda.to_device(weights), out)
+        
+        return out.copy_to_host()
+    
+    def _fixed_step_grid(self):
+        """
+        Output times for the fixed-step integrators.
+        
+        Returns:
+            Tuple (t, dt) with dt adjusted to divide the time span evenly
+        """
+        t_start, t_end = self.params['t_start'], self.params['t_end']
+        n_steps = int(np.ceil((t_end - t_start) / self.params['dt']))
+        dt = (t_end - t_start) / n_steps
+        return np.linspace(t_start, t_end, n_steps + 1), dt
 
 
 # ==============================================================================
 # SECTION 4: VALIDATION
 # ==============================================================================
 
+@njit(cache=True, fastmath=True)
+def compute_invariants(position, velocity, mu):
+    """
+    Radius, speed, specific energy and angular momentum magnitude along a
+    trajectory, computed in a single pass over the (N, 3) arrays.
+    
+    Returns:
+        Tuple (r_mag, v_mag, energy, h_mag) of arrays of length N
+    """
+    n = position.shape[0]
+    r_mag = np.empty(n)
+    v_mag = np.empty(n)
+    energy = np.empty(n)
+    h_mag = np.empty(n)
+    
+    for k in range(n):
+        rx, ry, rz = position[k, 0], position[k, 1], position[k, 2]
+        vx, vy, vz = velocity[k, 0], velocity[k, 1], velocity[k, 2]
+        r = sqrt(rx*rx + ry*ry + rz*rz)
+        v2 = vx*vx + vy*vy + vz*vz
+        hx = ry*vz - rz*vy
+        hy = rz*vx - rx*vz
+        hz = rx*vy - ry*vx
+        r_mag[k] = r
+        v_mag[k] = sqrt(v2)
+        energy[k] = 0.5*v2 - mu/r
+        h_mag[k] = sqrt(hx*hx + hy*hy + hz*hz)
+    
+    return r_mag, v_mag, energy, h_mag
+
+
 def validate_orbit(numerical, analytical, params):
     """
     Validate orbital solution.
@@ -350,24 +1003,17 @@ def validate_orbit(numerical, analytical, params):
         validation['passed'] = False
         validation['errors'].append("Orbit propagation failed")
     
-    # Check 2: Energy conservation
-    energy_initial = analytical['energy']
-    
-    # Compute energy at final state
-    r_final = numerical['position'][-1]
-    v_final = numerical['velocity'][-1]
-    r_mag_final = np.linalg.norm(r_final)
-    v_mag_final = np.linalg.norm(v_final)
-    energy_final = v_mag_final**2/2 - mu/r_mag_final
+    # Checks 2-3: Energy and angular momentum conservation along the trajectory
+    _, _, energy, h_mag = compute_invariants(numerical['position'],
+                                             numerical['velocity'], mu)
     
-    energy_error = abs(energy_final - energy_initial) / abs(energy_initial)
+    energy_initial = analytical['energy']
+    energy_error = np.max(np.abs(energy - energy_initial)) / abs(energy_initial)
     if energy_error > 1e-6:
         validation['warnings'].append(f"Energy conservation error: {energy_error:.2e}")
     
-    # Check 3: Angular momentum conservation
     h_initial = analytical['angular_momentum']
-    h_final = np.linalg.norm(np.cross(r_final, v_final))
-    h_error = abs(h_final - h_initial) / h_initial
+    h_error = np.max(np.abs(h_mag - h_initial)) / h_initial
     
     if h_error > 1e-6:
         validation['warnings'].append(f"Angular momentum error: {h_error:.2e}")
@@ -379,6 +1025,12 @@ def validate_orbit(numerical, analytical, params):
 # SECTION 5: VISUALIZATION
 # ==============================================================================
 
+# Unit-sphere mesh for drawing the Earth, built once and scaled by R_e
+_U, _V = np.meshgrid(np.linspace(0, 2 * np.pi, 100), np.linspace(0, np.pi, 100), indexing='ij')
+_SPHERE_X = np.cos(_U) * np.sin(_V)
+_SPHERE_Y = np.sin(_U) * np.sin(_V)
+_SPHERE_Z = np.cos(_V)
+
 def plot_orbit_results(numerical, elements, params):
     """
     Create comprehensive orbit visualization.
@@ -388,18 +1040,19 @@ def plot_orbit_results(numerical, elements, params):
         elements: Orbital elements
         params: Problem parameters
     """
+    # Radius, speed and specific energy along the trajectory, computed once
+    r_mag, velocity_mag, energy, _ = compute_invariants(
+        numerical['position'], numerical['velocity'], params['mu'])
+    
     fig = plt.figure(figsize=(16, 12))
     
     # Plot 1: 3D orbit
     ax1 = plt.subplot(2, 3, 1, projection='3d')
     
     # Plot Earth
-    u = np.linspace(0, 2 * np.pi, 100)
-    v = np.linspace(0, np.pi, 100)
-    x = params['R_e'] * np.outer(np.cos(u), np.sin(v))
-    y = params['R_e'] * np.outer(np.sin(u), np.sin(v))
-    z = params['R_e'] * np.outer(np.ones(np.size(u)), np.cos(v))
-    ax1.plot_surface(x, y, z, color='lightblue', alpha=0.3)
+    R_e = params['R_e']
+    ax1.plot_surface(R_e * _SPHERE_X, R_e * _SPHERE_Y, R_e * _SPHERE_Z,
+                     color='lightblue', alpha=0.3)
     
     # Plot orbit
     ax1.plot(numerical['position'][:, 0], 
@@ -437,7 +1090,7 @@ def plot_orbit_results(numerical, elements, params):
     
     # Plot 3: Altitude history
     ax3 = plt.subplot(2, 3, 3)
-    altitude = np.linalg.norm(numerical['position'], axis=1) - params['R_e']
+    altitude = r_mag - params['R_e']
     ax3.plot(numerical['t']/60, altitude, 'g-', linewidth=2)
     ax3.set_xlabel('Time [min]')
     ax3.set_ylabel('Altitude [km]')
@@ -446,7 +1099,6 @@ def plot_orbit_results(numerical, elements, params):
     
     # Plot 4: Energy conservation
     ax4 = plt.subplot(2, 3, 4)
-    energy = np.linalg.norm(numerical['velocity'], axis=1)**2/2 - params['mu']/np.linalg.norm(numerical['position'], axis=1)
     energy_error = 100 * (energy - elements['energy']) / abs(elements['energy'])
     ax4.plot(numerical['t']/60, energy_error, 'r-', linewidth=2)
     ax4.set_xlabel('Time [min]')
@@ -480,7 +1132,6 @@ def plot_orbit_results(numerical, elements, params):
     
     # Plot 6: Velocity profile
     ax6 = plt.subplot(2, 3, 6)
-    velocity_mag = np.linalg.norm(numerical['velocity'], axis=1)
     ax6.plot(numerical['t']/60, velocity_mag, 'purple', linewidth=2)
     ax6.set_xlabel('Time [min]')
     ax6.set_ylabel('Velocity [km/s]')
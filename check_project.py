@@ -9,14 +9,34 @@ import sys
 def check_file_completeness(filepath):
     """Check if a Python file is properly terminated"""
     try:
-        with open(filepath, 'r') as f:
-            lines = f.readlines()
-            if lines and "EOF" in lines[-1]:
+        # Only the last line matters, so read just the tail of the file
+        size = os.stat(filepath).st_size
+        with open(filepath, 'rb') as f:
+            if size > 256:
+                f.seek(-256, os.SEEK_END)
+            lines = f.read().splitlines()
+            if lines and b"EOF" in lines[-1]:
                 return False, "File ends with EOF marker"
             return True, "Complete"
     except Exception as e:
         return False, f"Error reading file: {e}"
 
+# Directories that never contain project sources
+SKIP_DIRS = {'.git', '__pycache__', '.venv'}
+
+def iter_py_files(root):
+    """Yield paths of Python files under root, using os.scandir"""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        stack.append(entry.path)
+                elif entry.name.endswith('.py'):
+                    yield entry.path
+
 def main():
     print("🔍 Verifying spacecraft-dynamics-control project...")
     
@@ -41,13 +61,7 @@ def main():
     
     # Check Python files
     print("\n🐍 Python files check:")
-    python_files = []
-    for root, dirs, files in os.walk('.'):
-        for file in files:
-            if file.endswith('.py'):
-                python_files.append(os.path.join(root, file))
-    
-    for py_file in python_files:
+    for py_file in iter_py_files('.'):
         complete, message = check_file_completeness(py_file)
         status = "✅" if complete else "❌"
         print(f"  {status} {py_file}: {message}")
@@ -0,0 +1,499 @@
+"""
+Compiled Kernels for Small-Vector Attitude Math
+
+Scalar implementations of the 3- and 4-element operations used on hot paths
+(Euler's equations, quaternion products, rotations, interpolation). With
+Numba installed they are compiled to native code; without it they run as
+plain Python.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; kernels then run as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, fastmath=True)
+def _euler_rhs(omega, I_diag, torque):
+    """
+    Euler's equations for a principal-axis inertia tensor
+
+    Parameters:
+    -----------
+    omega : np.ndarray
+        Angular velocity [rad/s]
+    I_diag : np.ndarray
+        Principal moments of inertia [kg⋅m²]
+    torque : np.ndarray
+        External torque [N⋅m]
+
+    Returns:
+    --------
+    np.ndarray
+        Angular acceleration [rad/s²]
+    """
+    wx, wy, wz = omega[0], omega[1], omega[2]
+    hx, hy, hz = I_diag[0]*wx, I_diag[1]*wy, I_diag[2]*wz
+
+    omega_dot = np.empty(3)
+    omega_dot[0] = (torque[0] - (wy*hz - wz*hy)) / I_diag[0]
+    omega_dot[1] = (torque[1] - (wz*hx - wx*hz)) / I_diag[1]
+    omega_dot[2] = (torque[2] - (wx*hy - wy*hx)) / I_diag[2]
+
+    return omega_dot
+
+
+@njit(cache=True, fastmath=True)
+def _quat_mul_into(q, p, out):
+    """
+    Hamilton product q ⊗ p of scalar-first quaternions, written into out
+
+    Parameters:
+    -----------
+    q, p : np.ndarray
+        Quaternions [q0, q1, q2, q3]
+    out : np.ndarray
+        Length-4 output buffer; may alias q or p
+
+    Returns:
+    --------
+    np.ndarray
+        out
+    """
+    q0, q1, q2, q3 = q[0], q[1], q[2], q[3]
+    p0, p1, p2, p3 = p[0], p[1], p[2], p[3]
+
+    out[0] = q0*p0 - q1*p1 - q2*p2 - q3*p3
+    out[1] = q0*p1 + q1*p0 + q2*p3 - q3*p2
+    out[2] = q0*p2 - q1*p3 + q2*p0 + q3*p1
+    out[3] = q0*p3 + q1*p2 - q2*p1 + q3*p0
+
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _quat_mul(q, p):
+    """
+    Hamilton product q ⊗ p of scalar-first quaternions
+
+    Parameters:
+    -----------
+    q, p : np.ndarray
+        Quaternions [q0, q1, q2, q3]
+
+    Returns:
+    --------
+    np.ndarray
+        Product quaternion
+    """
+    return _quat_mul_into(q, p, np.empty(4))
+
+
+@njit(cache=True, fastmath=True)
+def _quat_rotate_vector(q, v, out):
+    """
+    Rotate a 3-vector by a unit quaternion, v' = q ⊗ [0, v] ⊗ q*
+
+    Uses the expanded form t = 2 u x v, v' = v + q0 t + u x t (u the
+    vector part of q): 18 multiplies instead of two Hamilton products.
+    q must be unit-norm.
+
+    Parameters:
+    -----------
+    q : np.ndarray
+        Unit quaternion [q0, q1, q2, q3]
+    v : np.ndarray
+        Vector to rotate
+    out : np.ndarray
+        Length-3 output buffer; may alias v
+
+    Returns:
+    --------
+    np.ndarray
+        out
+    """
+    q0, ux, uy, uz = q[0], q[1], q[2], q[3]
+    vx, vy, vz = v[0], v[1], v[2]
+
+    tx = 2.0 * (uy*vz - uz*vy)
+    ty = 2.0 * (uz*vx - ux*vz)
+    tz = 2.0 * (ux*vy - uy*vx)
+
+    out[0] = vx + q0*tx + (uy*tz - uz*ty)
+    out[1] = vy + q0*ty + (uz*tx - ux*tz)
+    out[2] = vz + q0*tz + (ux*ty - uy*tx)
+
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _quat_to_rotation_matrix(q, out):
+    """
+    Rotation matrix of a unit quaternion, written into out
+
+    Parameters:
+    -----------
+    q : np.ndarray
+        Unit quaternion [q0, q1, q2, q3]
+    out : np.ndarray
+        3x3 output buffer
+
+    Returns:
+    --------
+    np.ndarray
+        out
+    """
+    q0, q1, q2, q3 = q[0], q[1], q[2], q[3]
+
+    out[0, 0] = 1.0 - 2.0*(q2*q2 + q3*q3)
+    out[0, 1] = 2.0*(q1*q2 - q0*q3)
+    out[0, 2] = 2.0*(q1*q3 + q0*q2)
+
+    out[1, 0] = 2.0*(q1*q2 + q0*q3)
+    out[1, 1] = 1.0 - 2.0*(q1*q1 + q3*q3)
+    out[1, 2] = 2.0*(q2*q3 - q0*q1)
+
+    out[2, 0] = 2.0*(q1*q3 - q0*q2)
+    out[2, 1] = 2.0*(q2*q3 + q0*q1)
+    out[2, 2] = 1.0 - 2.0*(q1*q1 + q2*q2)
+
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _quat_from_axis_angle(axis, angle, out):
+    """
+    Unit quaternion for a rotation of angle about axis, written into out
+
+    Parameters:
+    -----------
+    axis : np.ndarray
+        Rotation axis (normalized here; must be non-zero)
+    angle : float
+        Rotation angle [rad]
+    out : np.ndarray
+        Length-4 output buffer
+
+    Returns:
+    --------
+    np.ndarray
+        out
+    """
+    norm = np.sqrt(axis[0]*axis[0] + axis[1]*axis[1] + axis[2]*axis[2])
+    half = 0.5 * angle
+
+    if abs(angle) < 1e-4:
+        # Small rotation: Taylor series, exact to double precision here
+        half_sq = half * half
+        sin_half = half * (1.0 - half_sq / 6.0)
+        cos_half = 1.0 - 0.5 * half_sq
+    else:
+        sin_half = np.sin(half)
+        cos_half = np.cos(half)
+
+    s = sin_half / norm
+
+    out[0] = cos_half
+    out[1] = axis[0] * s
+    out[2] = axis[1] * s
+    out[3] = axis[2] * s
+
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _attitude_derivative(state, I, I_inv, torque, out):
+    """
+    Derivative of the attitude state [q0, q1, q2, q3, wx, wy, wz]
+
+    Quaternion kinematics q_dot = 0.5 * Omega(w) q coupled with Euler's
+    equations w_dot = I^-1 (torque - w x I w), written into out.
+    """
+    q0, q1, q2, q3 = state[0], state[1], state[2], state[3]
+    wx, wy, wz = state[4], state[5], state[6]
+
+    out[0] = 0.5 * (-wx*q1 - wy*q2 - wz*q3)
+    out[1] = 0.5 * (wx*q0 + wz*q2 - wy*q3)
+    out[2] = 0.5 * (wy*q0 - wz*q1 + wx*q3)
+    out[3] = 0.5 * (wz*q0 + wy*q1 - wx*q2)
+
+    hx = I[0, 0]*wx + I[0, 1]*wy + I[0, 2]*wz
+    hy = I[1, 0]*wx + I[1, 1]*wy + I[1, 2]*wz
+    hz = I[2, 0]*wx + I[2, 1]*wy + I[2, 2]*wz
+
+    mx = torque[0] - (wy*hz - wz*hy)
+    my = torque[1] - (wz*hx - wx*hz)
+    mz = torque[2] - (wx*hy - wy*hx)
+
+    out[4] = I_inv[0, 0]*mx + I_inv[0, 1]*my + I_inv[0, 2]*mz
+    out[5] = I_inv[1, 0]*mx + I_inv[1, 1]*my + I_inv[1, 2]*mz
+    out[6] = I_inv[2, 0]*mx + I_inv[2, 1]*my + I_inv[2, 2]*mz
+
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _rk4_attitude_step(q, omega, I, I_inv, torque, dt):
+    """
+    One classical RK4 step of the coupled quaternion / Euler equations
+
+    The torque is held constant over the step and the quaternion is
+    renormalized at the end.
+
+    Parameters:
+    -----------
+    q : np.ndarray
+        Attitude quaternion [q0, q1, q2, q3]
+    omega : np.ndarray
+        Angular velocity [rad/s]
+    I, I_inv : np.ndarray
+        Inertia tensor and its inverse (3x3)
+    torque : np.ndarray
+        External torque [N⋅m]
+    dt : float
+        Step size [s]
+
+    Returns:
+    --------
+    np.ndarray
+        New state [q0, q1, q2, q3, wx, wy, wz]
+    """
+    state = np.empty(7)
+    state[:4] = q
+    state[4:] = omega
+
+    k1 = _attitude_derivative(state, I, I_inv, torque, np.empty(7))
+    k2 = _attitude_derivative(state + 0.5*dt*k1, I, I_inv, torque, np.empty(7))
+    k3 = _attitude_derivative(state + 0.5*dt*k2, I, I_inv, torque, np.empty(7))
+    k4 = _attitude_derivative(state + dt*k3, I, I_inv, torque, np.empty(7))
+
+    for j in range(7):
+        state[j] += dt / 6.0 * (k1[j] + 2.0*k2[j] + 2.0*k3[j] + k4[j])
+
+    norm = np.sqrt(state[0]**2 + state[1]**2 + state[2]**2 + state[3]**2)
+    for j in range(4):
+        state[j] /= norm
+
+    return state
+
+
+# Eberly's polynomial SLERP ("A Fast and Accurate Algorithm for Computing
+# SLERP"); the last pair carries the error-balancing correction mu
+_SLERP_MU = 1.90110745351730037
+_SLERP_U = np.array([1.0 / ((i + 1) * (2*i + 3)) for i in range(7)] + [_SLERP_MU / (8 * 17)])
+_SLERP_V = np.array([(i + 1) / (2*i + 3) for i in range(7)] + [_SLERP_MU * 8 / 17])
+
+
+@njit(cache=True, fastmath=True)
+def _slerp_coefficients(cos_half_theta, t):
+    """
+    SLERP weights (c1, c2) such that slerp(q1, q2, t) = c1*q1 + c2*q2
+
+    Evaluates Eberly's degree-8 polynomial in x = cos(theta/2) - 1 instead
+    of arccos/sin; no division by sin(theta/2) is needed. Angular error is
+    about 1e-3 degrees.
+
+    Parameters:
+    -----------
+    cos_half_theta : float
+        Dot product of the two unit quaternions, already made non-negative
+    t : float
+        Interpolation parameter in [0, 1]
+
+    Returns:
+    --------
+    tuple
+        (c1, c2)
+    """
+    xm1 = cos_half_theta - 1.0
+    d = 1.0 - t
+    sqr_t = t * t
+    sqr_d = d * d
+
+    # Horner evaluation from the innermost term outwards
+    c_t = 1.0 + (_SLERP_U[7]*sqr_t - _SLERP_V[7]) * xm1
+    c_d = 1.0 + (_SLERP_U[7]*sqr_d - _SLERP_V[7]) * xm1
+    for i in range(6, -1, -1):
+        c_t = 1.0 + (_SLERP_U[i]*sqr_t - _SLERP_V[i]) * xm1 * c_t
+        c_d = 1.0 + (_SLERP_U[i]*sqr_d - _SLERP_V[i]) * xm1 * c_d
+
+    return d * c_d, t * c_t
+
+
+@njit(cache=True, fastmath=True)
+def _quat_mul_soa(a, b, out):
+    """
+    Element-wise Hamilton product of structure-of-arrays quaternions
+
+    One pass over the (4, N) component rows; the straight-line body has
+    unit stride in every row, so LLVM vectorizes it across quaternions.
+
+    Parameters:
+    -----------
+    a, b : np.ndarray
+        Quaternions as (4, N) arrays, one contiguous row per component
+    out : np.ndarray
+        (4, N) output buffer; may alias a or b
+
+    Returns:
+    --------
+    np.ndarray
+        out
+    """
+    for k in range(a.shape[1]):
+        q0, q1, q2, q3 = a[0, k], a[1, k], a[2, k], a[3, k]
+        p0, p1, p2, p3 = b[0, k], b[1, k], b[2, k], b[3, k]
+
+        out[0, k] = q0*p0 - q1*p1 - q2*p2 - q3*p3
+        out[1, k] = q0*p1 + q1*p0 + q2*p3 - q3*p2
+        out[2, k] = q0*p2 - q1*p3 + q2*p0 + q3*p1
+        out[3, k] = q0*p3 + q1*p2 - q2*p1 + q3*p0
+
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _rotation_x(angle, out):
+    """Elementary (frame) rotation about x by angle, written into a 3x3 out"""
+    c, s = np.cos(angle), np.sin(angle)
+
+    out[0, 0], out[0, 1], out[0, 2] = 1.0, 0.0, 0.0
+    out[1, 0], out[1, 1], out[1, 2] = 0.0, c, s
+    out[2, 0], out[2, 1], out[2, 2] = 0.0, -s, c
+
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _rotation_y(angle, out):
+    """Elementary (frame) rotation about y by angle, written into a 3x3 out"""
+    c, s = np.cos(angle), np.sin(angle)
+
+    out[0, 0], out[0, 1], out[0, 2] = c, 0.0, -s
+    out[1, 0], out[1, 1], out[1, 2] = 0.0, 1.0, 0.0
+    out[2, 0], out[2, 1], out[2, 2] = s, 0.0, c
+
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _rotation_z(angle, out):
+    """Elementary (frame) rotation about z by angle, written into a 3x3 out"""
+    c, s = np.cos(angle), np.sin(angle)
+
+    out[0, 0], out[0, 1], out[0, 2] = c, s, 0.0
+    out[1, 0], out[1, 1], out[1, 2] = -s, c, 0.0
+    out[2, 0], out[2, 1], out[2, 2] = 0.0, 0.0, 1.0
+
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _euler_321_matrix(phi, theta, psi, out):
+    """
+    3-2-1 rotation matrix R1(phi) R2(theta) R3(psi) in closed form
+
+    Parameters:
+    -----------
+    phi, theta, psi : float
+        Roll, pitch and yaw angles [rad]
+    out : np.ndarray
+        3x3 output buffer
+
+    Returns:
+    --------
+    np.ndarray
+        out
+    """
+    c1, s1 = np.cos(phi), np.sin(phi)
+    c2, s2 = np.cos(theta), np.sin(theta)
+    c3, s3 = np.cos(psi), np.sin(psi)
+
+    out[0, 0] = c2*c3
+    out[0, 1] = c2*s3
+    out[0, 2] = -s2
+
+    out[1, 0] = s1*s2*c3 - c1*s3
+    out[1, 1] = s1*s2*s3 + c1*c3
+    out[1, 2] = s1*c2
+
+    out[2, 0] = c1*s2*c3 + s1*s3
+    out[2, 1] = c1*s2*s3 - s1*c3
+    out[2, 2] = c1*c2
+
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _is_rotation_matrix(R, tol):
+    """
+    True if the 3x3 R is orthonormal with det(R) = +1, within tol
+
+    Checks each entry of R^T R against the identity (column norms and
+    column dot products) and the determinant as a scalar triple product,
+    returning at the first failure.
+    """
+    for i in range(3):
+        for j in range(i, 3):
+            dot = R[0, i]*R[0, j] + R[1, i]*R[1, j] + R[2, i]*R[2, j]
+            if i == j:
+                dot -= 1.0
+            if abs(dot) > tol:
+                return False
+
+    det = (R[0, 0]*(R[1, 1]*R[2, 2] - R[1, 2]*R[2, 1])
+           - R[0, 1]*(R[1, 0]*R[2, 2] - R[1, 2]*R[2, 0])
+           + R[0, 2]*(R[1, 0]*R[2, 1] - R[1, 1]*R[2, 0]))
+
+    return abs(det - 1.0) <= tol
+
+
+@njit(cache=True, fastmath=True)
+def _axis_angle_matrix(axis, angle, out):
+    """
+    Rodrigues rotation matrix in closed form, written into out
+
+    R = cos(a) I + (1 - cos(a)) k kᵀ + sin(a) [k]x, with k the normalized
+    axis, filled entry by entry (no skew matrix or K @ K product).
+
+    Parameters:
+    -----------
+    axis : np.ndarray
+        Rotation axis (normalized here; must be non-zero)
+    angle : float
+        Rotation angle [rad]
+    out : np.ndarray
+        3x3 output buffer
+
+    Returns:
+    --------
+    np.ndarray
+        out
+    """
+    norm = np.sqrt(axis[0]*axis[0] + axis[1]*axis[1] + axis[2]*axis[2])
+    kx, ky, kz = axis[0] / norm, axis[1] / norm, axis[2] / norm
+
+    c, s = np.cos(angle), np.sin(angle)
+    C = 1.0 - c
+
+    xy, xz, yz = kx*ky*C, kx*kz*C, ky*kz*C
+    xs, ys, zs = kx*s, ky*s, kz*s
+
+    out[0, 0] = c + kx*kx*C
+    out[0, 1] = xy - zs
+    out[0, 2] = xz + ys
+
+    out[1, 0] = xy + zs
+    out[1, 1] = c + ky*ky*C
+    out[1, 2] = yz - xs
+
+    out[2, 0] = xz - ys
+    out[2, 1] = yz + xs
+    out[2, 2] = c + kz*kz*C
+
+    return out
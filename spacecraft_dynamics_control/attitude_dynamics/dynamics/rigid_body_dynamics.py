@@ -3,9 +3,29 @@ Dinámica de cuerpo rígido para naves espaciales
 """
 
 import numpy as np
+from functools import lru_cache
 from typing import Tuple, Dict, Optional
 import numpy.typing as npt
 
+from ..._kernels import _euler_rhs, _rk4_attitude_step
+
+@lru_cache(maxsize=8)
+def _inv3(key_bytes: bytes) -> npt.NDArray:
+    """Inversa de un tensor 3x3, memorizada por su contenido (float64)"""
+    I_inv = np.linalg.inv(np.frombuffer(key_bytes).reshape(3, 3))
+    I_inv.flags.writeable = False
+    return I_inv
+
+def _cross3(a: npt.NDArray, b: npt.NDArray) -> npt.NDArray:
+    """Producto vectorial de dos vectores 3D, sin la sobrecarga de np.cross"""
+    a0, a1, a2 = a
+    b0, b1, b2 = b
+    return np.array([a1*b2 - a2*b1, a2*b0 - a0*b2, a0*b1 - a1*b0])
+
+def _inertia_inverse(I: npt.NDArray) -> npt.NDArray:
+    """Inversa del tensor de inercia; se calcula una sola vez por tensor"""
+    return _inv3(np.ascontiguousarray(I, dtype=float).tobytes())
+
 class RigidBodyDynamics:
     """
     Dinámica de cuerpo rígido para naves espaciales
@@ -18,7 +38,7 @@ class RigidBodyDynamics:
         
         Args:
             omega: Velocidad angular [rad/s]
-            I: Tensor de inercia [kg⋅m²]
+            I: Tensor de inercia 3x3, o momentos principales (3,) [kg⋅m²]
             torque: Torque externo [N⋅m] (opcional)
             
         Returns:
@@ -27,21 +47,96 @@ class RigidBodyDynamics:
         if torque is None:
             torque = np.zeros(3)
         
-        I_inv = np.linalg.inv(I)
-        gyro_term = np.cross(omega, I @ omega)
+        # Ejes principales: kernel escalar compilado
+        if I.ndim == 1 or RigidBodyDynamics._is_diagonal(I):
+            I_diag = I if I.ndim == 1 else np.diagonal(I)
+            return _euler_rhs(np.asarray(omega, dtype=float),
+                              np.asarray(I_diag, dtype=float),
+                              np.asarray(torque, dtype=float))
+        
+        gyro_term = _cross3(omega, I @ omega)
         
-        omega_dot = I_inv @ (torque - gyro_term)
+        omega_dot = _inertia_inverse(I) @ (torque - gyro_term)
         
         return omega_dot
     
+    @staticmethod
+    def euler_equations_batch(omega: npt.NDArray, I: npt.NDArray, torque: npt.NDArray = None) -> npt.NDArray:
+        """
+        Ecuaciones de Euler para N velocidades angulares a la vez
+        
+        Args:
+            omega: Velocidades angulares (N, 3) [rad/s]
+            I: Tensor de inercia 3x3, o momentos principales (3,) [kg⋅m²]
+            torque: Torques externos (N, 3) o (3,) [N⋅m] (opcional)
+            
+        Returns:
+            Aceleraciones angulares (N, 3) [rad/s²]
+        """
+        if I.ndim == 1:
+            gyro_term = np.cross(omega, omega * I)
+            rhs = -gyro_term if torque is None else torque - gyro_term
+            return rhs / I
+        
+        h = omega @ I.T
+        gyro_term = np.cross(omega, h)
+        
+        rhs = -gyro_term if torque is None else torque - gyro_term
+        
+        if RigidBodyDynamics._is_diagonal(I):
+            return rhs / np.diagonal(I)
+        
+        return rhs @ _inertia_inverse(I).T
+    
+    @staticmethod
+    def rk4_attitude_step(omega: npt.NDArray, q: npt.NDArray, I: npt.NDArray,
+                          torque: npt.NDArray, dt: float) -> Tuple[npt.NDArray, npt.NDArray]:
+        """
+        Un paso RK4 de las ecuaciones de Euler acopladas con la cinemática
+        del cuaternión q_dot = 0.5 * Omega(ω) q
+        
+        Todo el paso se ejecuta en un kernel compilado (Numba), sin
+        llamadas a Python por etapa. El torque se mantiene constante
+        durante el paso y el cuaternión se renormaliza al final.
+        
+        Args:
+            omega: Velocidad angular [rad/s]
+            q: Cuaternión de actitud [q0, q1, q2, q3]
+            I: Tensor de inercia 3x3, o momentos principales (3,) [kg⋅m²]
+            torque: Torque externo [N⋅m]
+            dt: Paso de integración [s]
+            
+        Returns:
+            Tupla (omega, q) al final del paso
+        """
+        I = np.asarray(I, dtype=float)
+        if I.ndim == 1:
+            I = np.diag(I)
+        
+        state = _rk4_attitude_step(np.asarray(q, dtype=float),
+                                   np.asarray(omega, dtype=float),
+                                   I, _inertia_inverse(I),
+                                   np.asarray(torque, dtype=float), float(dt))
+        
+        return state[4:], state[:4]
+    
+    @staticmethod
+    def _is_diagonal(I: npt.NDArray) -> bool:
+        """True si el tensor de inercia no tiene productos de inercia"""
+        return np.count_nonzero(I - np.diag(np.diagonal(I))) == 0
+    
     @staticmethod
     def angular_momentum(omega: npt.NDArray, I: npt.NDArray) -> npt.NDArray:
-        """Momento angular h = I⋅ω"""
+        """Momento angular h = I⋅ω (I 3x3 o momentos principales (3,))"""
+        if I.ndim == 1:
+            return I * omega
         return I @ omega
     
     @staticmethod
     def kinetic_energy(omega: npt.NDArray, I: npt.NDArray) -> float:
-        """Energía cinética T = 0.5 * ωᵀ I ω"""
+        """Energía cinética T = 0.5 * ωᵀ I ω (I 3x3 o momentos principales (3,))"""
+        if I.ndim == 1:
+            return 0.5 * np.dot(I * omega, omega)
         return 0.5 * omega.T @ I @ omega
     
     @staticmethod
@@ -56,10 +151,27 @@ class RigidBodyDynamics:
         Returns:
             Tensor de inercia [kg⋅m²]
         """
+        return np.diag(RigidBodyDynamics.inertia_tensor_diag(mass, dimensions))
+    
+    @staticmethod
+    def inertia_tensor_diag(mass: float, dimensions: npt.NDArray) -> npt.NDArray:
+        """
+        Momentos principales de inercia de un cuerpo rígido rectangular
+        
+        Las funciones de esta clase aceptan este vector (3,) en lugar del
+        tensor 3x3, evitando operar con los ceros fuera de la diagonal.
+        
+        Args:
+            mass: Masa total [kg]
+            dimensions: Dimensiones [largo, ancho, alto] [m]
+            
+        Returns:
+            Momentos principales [I_xx, I_yy, I_zz] [kg⋅m²]
+        """
         a, b, c = dimensions / 2  # Semiejes
         
         I_xx = (mass / 3) * (b**2 + c**2)
         I_yy = (mass / 3) * (a**2 + c**2)
         I_zz = (mass / 3) * (a**2 + b**2)
         
-        return np.diag([I_xx, I_yy, I_zz])
+        return np.array([I_xx, I_yy, I_zz])
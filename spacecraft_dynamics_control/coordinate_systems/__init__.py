@@ -9,28 +9,66 @@ Includes:
 - Reference frame definitions and conversions
 - Quaternion operations for attitude representation
 - Coordinate transformation utilities
+
+Submodules are imported on first attribute access (PEP 562), so importing
+the package itself stays cheap.
 """
 
-from .rotation_matrices import RotationMatrix, RotationMatrix3D, create_rotation_matrix
-from .reference_frames import ReferenceFrame, ECI, ECEF, BodyFrame, ECI_FRAME, ECEF_FRAME
-from .coordinate_transformations import transform_vector, transform_matrix, eci_to_ecef, ecef_to_eci
-from .quaternion_operations import Quaternion, quaternion_from_euler, euler_from_quaternion
-
-__all__ = [
-    'RotationMatrix',
-    'RotationMatrix3D', 
-    'create_rotation_matrix',
-    'ReferenceFrame',
-    'ECI',
-    'ECEF', 
-    'BodyFrame',
-    'ECI_FRAME',
-    'ECEF_FRAME',
-    'transform_vector',
-    'transform_matrix',
-    'eci_to_ecef',
-    'ecef_to_eci',
-    'Quaternion',
-    'quaternion_from_euler',
-    'euler_from_quaternion'
-]
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # Eager imports for static analysis only
+    from .rotation_matrices import (
+        RotationMatrix, RotationMatrix3D, create_rotation_matrix, is_rotation_matrix,
+    )
+    from .reference_frames import ReferenceFrame, ECI, ECEF, BodyFrame, ECI_FRAME, ECEF_FRAME
+    from .coordinate_transformations import (
+        transform_vector, transform_matrix,
+        eci_to_ecef, ecef_to_eci,
+        make_eci_ecef_matrix, make_eci_ecef_matrices,
+    )
+    from .quaternion_operations import (
+        Quaternion, QuaternionArray, quaternion_multiply_batch,
+        slerp, slerp_batch,
+        quaternion_from_euler, euler_from_quaternion,
+    )
+
+# Public name -> submodule that defines it
+_SUBMODULE_OF = {
+    'RotationMatrix': 'rotation_matrices',
+    'RotationMatrix3D': 'rotation_matrices',
+    'create_rotation_matrix': 'rotation_matrices',
+    'is_rotation_matrix': 'rotation_matrices',
+    'ReferenceFrame': 'reference_frames',
+    'ECI': 'reference_frames',
+    'ECEF': 'reference_frames',
+    'BodyFrame': 'reference_frames',
+    'ECI_FRAME': 'reference_frames',
+    'ECEF_FRAME': 'reference_frames',
+    'transform_vector': 'coordinate_transformations',
+    'transform_matrix': 'coordinate_transformations',
+    'eci_to_ecef': 'coordinate_transformations',
+    'ecef_to_eci': 'coordinate_transformations',
+    'make_eci_ecef_matrix': 'coordinate_transformations',
+    'make_eci_ecef_matrices': 'coordinate_transformations',
+    'Quaternion': 'quaternion_operations',
+    'QuaternionArray': 'quaternion_operations',
+    'quaternion_multiply_batch': 'quaternion_operations',
+    'slerp': 'quaternion_operations',
+    'slerp_batch': 'quaternion_operations',
+    'quaternion_from_euler': 'quaternion_operations',
+    'euler_from_quaternion': 'quaternion_operations',
+}
+
+__all__ = list(_SUBMODULE_OF)
+
+def __getattr__(name):
+    submodule = _SUBMODULE_OF.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{submodule}', __name__), name)
+    globals()[name] = value  # Later lookups bypass __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,7 +5,9 @@ This module provides utility functions for coordinate transformations
 between different reference frames.
 """
 
+import math
 import numpy as np
+from functools import lru_cache
 from typing import Union
 
 def transform_vector(vector: np.ndarray, rotation_matrix: np.ndarray) -> np.ndarray:
@@ -54,16 +56,19 @@ def transform_matrix(matrix: np.ndarray, rotation_matrix: np.ndarray) -> np.ndar
     
     return rotation_matrix @ matrix @ rotation_matrix.T
 
-def eci_to_ecef(vector_eci: np.ndarray, gmst: float) -> np.ndarray:
+def eci_to_ecef(vector_eci: np.ndarray, gmst: Union[float, np.ndarray],
+                out: np.ndarray = None) -> np.ndarray:
     """
     Transform vector from ECI to ECEF frame
     
     Parameters:
     -----------
     vector_eci : np.ndarray
-        Vector in ECI frame
-    gmst : float
-        Greenwich Mean Sidereal Time in radians
+        Vector in ECI frame, shape (3,) or (N, 3)
+    gmst : float or np.ndarray
+        Greenwich Mean Sidereal Time in radians (scalar or one per vector)
+    out : np.ndarray, optional
+        Preallocated output array with the same shape as vector_eci
         
     Returns:
     --------
@@ -71,27 +76,21 @@ def eci_to_ecef(vector_eci: np.ndarray, gmst: float) -> np.ndarray:
         Vector in ECEF frame
     """
     # Rotation about Z-axis by GMST
-    cos_gmst = np.cos(gmst)
-    sin_gmst = np.sin(gmst)
-    
-    R_eci_to_ecef = np.array([
-        [cos_gmst, sin_gmst, 0],
-        [-sin_gmst, cos_gmst, 0],
-        [0, 0, 1]
-    ])
-    
-    return R_eci_to_ecef @ vector_eci
+    return _rotate_z(vector_eci, gmst, out)
 
-def ecef_to_eci(vector_ecef: np.ndarray, gmst: float) -> np.ndarray:
+def ecef_to_eci(vector_ecef: np.ndarray, gmst: Union[float, np.ndarray],
+                out: np.ndarray = None) -> np.ndarray:
     """
     Transform vector from ECEF to ECI frame
     
     Parameters:
     -----------
     vector_ecef : np.ndarray
-        Vector in ECEF frame
-    gmst : float
-        Greenwich Mean Sidereal Time in radians
+        Vector in ECEF frame, shape (3,) or (N, 3)
+    gmst : float or np.ndarray
+        Greenwich Mean Sidereal Time in radians (scalar or one per vector)
+    out : np.ndarray, optional
+        Preallocated output array with the same shape as vector_ecef
         
     Returns:
     --------
@@ -99,20 +98,107 @@ def ecef_to_eci(vector_ecef: np.ndarray, gmst: float) -> np.ndarray:
         Vector in ECI frame
     """
     # Inverse rotation (transpose)
-    cos_gmst = np.cos(gmst)
-    sin_gmst = np.sin(gmst)
+    return _rotate_z(vector_ecef, -gmst, out)
+
+def make_eci_ecef_matrix(gmst: float) -> np.ndarray:
+    """
+    Rotation matrix from ECI to ECEF frame
     
-    R_ecef_to_eci = np.array([
-        [cos_gmst, -sin_gmst, 0],
-        [sin_gmst, cos_gmst, 0],
-        [0, 0, 1]
+    Matrices are cached per GMST value, so converting many vectors or
+    matrices at one epoch builds the rotation only once. The transpose
+    gives the ECEF-to-ECI rotation.
+    
+    Parameters:
+    -----------
+    gmst : float
+        Greenwich Mean Sidereal Time in radians
+        
+    Returns:
+    --------
+    np.ndarray
+        3x3 rotation matrix (read-only; copy before modifying)
+    """
+    return _eci_ecef_matrix(float(gmst))
+
+def make_eci_ecef_matrices(gmst: np.ndarray) -> np.ndarray:
+    """
+    Rotation matrices from ECI to ECEF for a whole timeline
+    
+    One cos/sin evaluation over the array and one vectorized assembly,
+    instead of a matrix per sample. Apply to position histories with
+    np.einsum('nij,nj->ni', T, r_eci), or use eci_to_ecef directly,
+    which accepts an array of GMST values.
+    
+    Parameters:
+    -----------
+    gmst : np.ndarray
+        Greenwich Mean Sidereal Time in radians, shape (N,)
+        
+    Returns:
+    --------
+    np.ndarray
+        Rotation matrices of shape (N, 3, 3)
+    """
+    gmst = np.asarray(gmst, dtype=float).ravel()
+    cos_gmst, sin_gmst = np.cos(gmst), np.sin(gmst)
+    
+    T = np.zeros((gmst.size, 3, 3))
+    T[:, 0, 0] = cos_gmst
+    T[:, 0, 1] = sin_gmst
+    T[:, 1, 0] = -sin_gmst
+    T[:, 1, 1] = cos_gmst
+    T[:, 2, 2] = 1.0
+    return T
+
+@lru_cache(maxsize=1024)
+def _eci_ecef_matrix(gmst: float) -> np.ndarray:
+    cos_gmst, sin_gmst = math.cos(gmst), math.sin(gmst)
+    R = np.array([
+        [cos_gmst, sin_gmst, 0.0],
+        [-sin_gmst, cos_gmst, 0.0],
+        [0.0, 0.0, 1.0]
     ])
+    R.flags.writeable = False
+    return R
+
+def _rotate_z(vector: np.ndarray, angle: Union[float, np.ndarray],
+              out: np.ndarray = None) -> np.ndarray:
+    """
+    Frame rotation about Z by angle, written component-wise; the Z component
+    passes through unchanged, so no 3x3 matrix is built
+    """
+    vector = np.asarray(vector)
+    if out is None:
+        out = np.empty(vector.shape)
+    
+    if np.ndim(angle) == 0:
+        cos_angle, sin_angle = math.cos(angle), math.sin(angle)
+    else:
+        cos_angle, sin_angle = np.cos(angle), np.sin(angle)
+    
+    if vector.ndim == 1:
+        x, y = float(vector[0]), float(vector[1])
+        out[0] = cos_angle * x + sin_angle * y
+        out[1] = cos_angle * y - sin_angle * x
+        out[2] = vector[2]
+        return out
+    
+    x, y = vector[:, 0], vector[:, 1]
+    x_rot = cos_angle * x + sin_angle * y
+    y_rot = cos_angle * y - sin_angle * x
+    
+    # Assign only after both are computed, so out may alias vector
+    out[:, 0] = x_rot
+    out[:, 1] = y_rot
+    out[:, 2] = vector[:, 2]
     
-    return R_ecef_to_eci @ vector_ecef
+    return out
 
 __all__ = [
     'transform_vector', 
     'transform_matrix',
     'eci_to_ecef', 
-    'ecef_to_eci'
+    'ecef_to_eci',
+    'make_eci_ecef_matrix',
+    'make_eci_ecef_matrices'
 ]
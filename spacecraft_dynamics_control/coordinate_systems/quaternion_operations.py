@@ -5,9 +5,36 @@ This module provides quaternion operations for spacecraft attitude representatio
 and transformations between different attitude parameterizations.
 """
 
+import math
 import numpy as np
+from functools import lru_cache
 from typing import Union, Tuple
 
+from .rotation_matrices import is_rotation_matrix
+from .._kernels import (_quat_mul, _quat_mul_into, _quat_rotate_vector,
+                        _quat_to_rotation_matrix, _quat_from_axis_angle,
+                        _quat_mul_soa, _slerp_coefficients)
+
+@lru_cache(maxsize=4096)
+def _quaternion_from_euler_321(phi: float, theta: float, psi: float) -> Tuple[float, float, float, float]:
+    """Quaternion components for a 3-2-1 Euler sequence, memoized on the exact angles"""
+    # Half angles
+    half_phi = phi / 2.0
+    half_theta = theta / 2.0
+    half_psi = psi / 2.0
+    
+    # math trig on scalars avoids a NumPy ufunc dispatch per call
+    c1, s1 = math.cos(half_psi), math.sin(half_psi)  # yaw
+    c2, s2 = math.cos(half_theta), math.sin(half_theta)  # pitch
+    c3, s3 = math.cos(half_phi), math.sin(half_phi)  # roll
+    
+    q0 = c1 * c2 * c3 + s1 * s2 * s3
+    q1 = c1 * c2 * s3 - s1 * s2 * c3
+    q2 = c1 * s2 * c3 + s1 * c2 * s3
+    q3 = s1 * c2 * c3 - c1 * s2 * s3
+    
+    return q0, q1, q2, q3
+
 class Quaternion:
     """
     Quaternion class for attitude representation
@@ -15,6 +42,9 @@ class Quaternion:
     Quaternion format: [q0, q1, q2, q3] where q0 is scalar part
     """
     
+    # No per-instance __dict__: each quaternion is just its 4-element array
+    __slots__ = ('q',)
+    
     def __init__(self, q: Union[list, tuple, np.ndarray] = None):
         """
         Initialize quaternion
@@ -49,32 +79,103 @@ class Quaternion:
         Quaternion
             Quaternion object
         """
-        angles = np.array(angles)
         if len(angles) != 3:
             raise ValueError("Must provide exactly 3 Euler angles")
         
-        phi, theta, psi = angles
+        if sequence != '321':
+            raise NotImplementedError(f"Rotation sequence {sequence} not implemented")
         
-        # Half angles
-        half_phi = phi / 2.0
-        half_theta = theta / 2.0  
-        half_psi = psi / 2.0
+        phi, theta, psi = (float(a) for a in angles)
         
-        # Compute quaternion elements for 3-2-1 sequence
-        if sequence == '321':
-            c1, s1 = np.cos(half_psi), np.sin(half_psi)  # yaw
-            c2, s2 = np.cos(half_theta), np.sin(half_theta)  # pitch
-            c3, s3 = np.cos(half_phi), np.sin(half_phi)  # roll
+        # Repeated setpoints hit the cache instead of recomputing the trig
+        return cls(_quaternion_from_euler_321(phi, theta, psi))
+    
+    @classmethod
+    def from_axis_angle(cls, axis: Union[list, tuple, np.ndarray], angle: float) -> 'Quaternion':
+        """
+        Create quaternion from a rotation axis and angle
+        
+        Parameters:
+        -----------
+        axis : array-like
+            Rotation axis (need not be normalized, must be non-zero)
+        angle : float
+            Rotation angle in radians
             
-            q0 = c1 * c2 * c3 + s1 * s2 * s3
-            q1 = c1 * c2 * s3 - s1 * s2 * c3
-            q2 = c1 * s2 * c3 + s1 * c2 * s3
-            q3 = s1 * c2 * c3 - c1 * s2 * s3
+        Returns:
+        --------
+        Quaternion
+            Unit quaternion
+        """
+        axis = np.ascontiguousarray(axis, dtype=np.float64)
+        if len(axis) != 3:
+            raise ValueError("Rotation axis must have 3 elements")
+        return cls(_quat_from_axis_angle(axis, float(angle), np.empty(4)))
+    
+    @classmethod
+    def from_rotation_matrix(cls, matrix: np.ndarray, check: bool = False) -> 'Quaternion':
+        """
+        Create quaternion from a rotation matrix (Shoemake's method)
+        
+        All products 4 q_i q_j are formed at once and the row with the
+        largest diagonal 4 q_k² is picked by index rather than through an
+        if/elif cascade; dividing by the largest component keeps the
+        result well conditioned.
+        
+        Parameters:
+        -----------
+        matrix : np.ndarray
+            3x3 rotation matrix. Orthogonality is assumed, not verified,
+            unless check is True
+        check : bool
+            Validate the input with is_rotation_matrix first (for I/O and
+            tests; leave off in attitude loops)
             
-        else:
-            raise NotImplementedError(f"Rotation sequence {sequence} not implemented")
+        Returns:
+        --------
+        Quaternion
+            Unit quaternion with q_k > 0 for the selected component
+        """
+        R = np.asarray(matrix, dtype=float)
+        if R.shape != (3, 3):
+            raise ValueError("Rotation matrix must be 3x3")
+        if check and not is_rotation_matrix(R):
+            raise ValueError("Matrix is not a proper rotation matrix")
+        
+        (r00, r01, r02), (r10, r11, r12), (r20, r21, r22) = R.tolist()
+        trace = r00 + r11 + r22
+        a, b, c = r21 - r12, r02 - r20, r10 - r01  # 4 q0 q1, 4 q0 q2, 4 q0 q3
+        d, e, f = r01 + r10, r02 + r20, r12 + r21  # 4 q1 q2, 4 q1 q3, 4 q2 q3
+        
+        # Rows of 4 q qᵀ; the diagonal holds 4 q_k²
+        rows = ((1.0 + trace, a, b, c),
+                (a, 1.0 + 2.0*r00 - trace, d, e),
+                (b, d, 1.0 + 2.0*r11 - trace, f),
+                (c, e, f, 1.0 + 2.0*r22 - trace))
+        diagonal = [rows[i][i] for i in range(4)]
+        k = diagonal.index(max(diagonal))
         
-        return cls([q0, q1, q2, q3])
+        scale = 0.5 / math.sqrt(diagonal[k])
+        return cls([scale * x for x in rows[k]])
+    
+    @staticmethod
+    def from_euler_angles_batch(angles: np.ndarray, sequence: str = '321') -> np.ndarray:
+        """
+        Create quaternions from many sets of Euler angles at once
+        
+        Parameters:
+        -----------
+        angles : array-like
+            Euler angles in radians, shape (N, 3) as [phi, theta, psi]
+        sequence : str
+            Rotation sequence (default '321' for yaw-pitch-roll)
+            
+        Returns:
+        --------
+        np.ndarray
+            Quaternions of shape (N, 4)
+        """
+        return np.ascontiguousarray(QuaternionArray.from_euler_batch(angles, sequence).q)
     
     def to_euler_angles(self, sequence: str = '321') -> np.ndarray:
         """
@@ -90,18 +191,69 @@ class Quaternion:
         np.ndarray
             Euler angles in radians [phi, theta, psi]
         """
-        q0, q1, q2, q3 = self.q
+        q0, q1, q2, q3 = (float(c) for c in self.q)
         
         if sequence == '321':
             # 3-2-1 sequence (yaw-pitch-roll)
-            phi = np.arctan2(2*(q0*q1 + q2*q3), 1 - 2*(q1**2 + q2**2))
-            theta = np.arcsin(2*(q0*q2 - q3*q1))
-            psi = np.arctan2(2*(q0*q3 + q1*q2), 1 - 2*(q2**2 + q3**2))
+            phi = math.atan2(2*(q0*q1 + q2*q3), 1 - 2*(q1**2 + q2**2))
+            # Clamped: math.asin raises on rounding just past +-1
+            theta = math.asin(min(1.0, max(-1.0, 2*(q0*q2 - q3*q1))))
+            psi = math.atan2(2*(q0*q3 + q1*q2), 1 - 2*(q2**2 + q3**2))
         else:
             raise NotImplementedError(f"Rotation sequence {sequence} not implemented")
         
         return np.array([phi, theta, psi])
     
+    def rotate_vector(self, vector: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        """
+        Rotate a vector (or N vectors) by this quaternion
+        
+        The quaternion must be unit-norm; no normalization is applied.
+        
+        Parameters:
+        -----------
+        vector : np.ndarray
+            3D vector, or array of shape (N, 3)
+        out : np.ndarray, optional
+            Float array of the same shape receiving the result (may be
+            vector itself); allocated if None
+            
+        Returns:
+        --------
+        np.ndarray
+            Rotated vector(s) q ⊗ v ⊗ q*
+        """
+        vector = np.ascontiguousarray(vector, dtype=np.float64)
+        if out is None:
+            out = np.empty(vector.shape)
+        if vector.ndim == 2:
+            # v' = v + q0 t + u x t with t = 2 u x v, broadcast over rows
+            u = self.q[1:]
+            t = 2.0 * np.cross(u, vector)
+            np.add(vector, self.q[0] * t, out=out)
+            out += np.cross(u, t)
+            return out
+        return _quat_rotate_vector(np.ascontiguousarray(self.q, dtype=np.float64),
+                                   vector, out)
+    
+    def to_rotation_matrix(self, out: np.ndarray = None) -> np.ndarray:
+        """
+        Convert (unit) quaternion to rotation matrix
+        
+        Parameters:
+        -----------
+        out : np.ndarray, optional
+            3x3 float array receiving the matrix; allocated if None
+            
+        Returns:
+        --------
+        np.ndarray
+            3x3 rotation matrix
+        """
+        if out is None:
+            out = np.empty((3, 3))
+        return _quat_to_rotation_matrix(np.ascontiguousarray(self.q, dtype=np.float64), out)
+    
     def conjugate(self) -> 'Quaternion':
         """
         Get quaternion conjugate
@@ -113,9 +265,13 @@ class Quaternion:
         """
         return Quaternion([self.q[0], -self.q[1], -self.q[2], -self.q[3]])
     
-    def inverse(self) -> 'Quaternion':
+    def inverse_unit(self) -> 'Quaternion':
         """
-        Get quaternion inverse (conjugate for unit quaternion)
+        Get inverse of a unit quaternion (its conjugate)
+        
+        Skips the division by the squared norm; only valid when the
+        quaternion is already normalized, as every rotation produced in
+        this module is.
         
         Returns:
         --------
@@ -124,6 +280,21 @@ class Quaternion:
         """
         return self.conjugate()
     
+    def inverse(self) -> 'Quaternion':
+        """
+        Get quaternion inverse q* / |q|² (valid for any non-zero quaternion)
+        
+        Returns:
+        --------
+        Quaternion
+            Inverse quaternion
+        """
+        q0, q1, q2, q3 = (float(c) for c in self.q)
+        norm_sq = q0*q0 + q1*q1 + q2*q2 + q3*q3
+        if norm_sq == 0.0:
+            raise ValueError("Cannot invert a zero quaternion")
+        return Quaternion([q0 / norm_sq, -q1 / norm_sq, -q2 / norm_sq, -q3 / norm_sq])
+    
     def norm(self) -> float:
         """
         Get quaternion norm
@@ -133,7 +304,9 @@ class Quaternion:
         float
             Quaternion norm
         """
-        return np.linalg.norm(self.q)
+        # Four scalar products beat np.linalg.norm's dispatch on 4 elements
+        q0, q1, q2, q3 = self.q.tolist()
+        return math.sqrt(q0*q0 + q1*q1 + q2*q2 + q3*q3)
     
     def normalize(self) -> 'Quaternion':
         """
@@ -163,19 +336,469 @@ class Quaternion:
         Quaternion
             Product quaternion
         """
-        q0, q1, q2, q3 = self.q
-        p0, p1, p2, p3 = other.q
+        return Quaternion(_quat_mul(self.q, other.q))
+    
+    def mul_into(self, other: 'Quaternion', out: np.ndarray) -> np.ndarray:
+        """
+        Quaternion multiplication into a caller-supplied buffer
         
-        r0 = q0*p0 - q1*p1 - q2*p2 - q3*p3
-        r1 = q0*p1 + q1*p0 + q2*p3 - q3*p2
-        r2 = q0*p2 - q1*p3 + q2*p0 + q3*p1
-        r3 = q0*p3 + q1*p2 - q2*p1 + q3*p0
+        Avoids creating a new Quaternion per product in tight loops.
         
-        return Quaternion([r0, r1, r2, r3])
+        Parameters:
+        -----------
+        other : Quaternion
+            Other quaternion
+        out : np.ndarray
+            Float array of length 4 receiving the product (may be self.q)
+            
+        Returns:
+        --------
+        np.ndarray
+            out
+        """
+        return _quat_mul_into(self.q, other.q, out)
     
     def __str__(self) -> str:
         return f"Quaternion({self.q})"
 
+class QuaternionArray:
+    """
+    Structure-of-arrays container for many quaternions
+    
+    Components are stored as a (4, N) array so that each of q0, q1, q2, q3
+    is a contiguous row; vectorized operations then stream over memory
+    instead of striding through per-quaternion objects.
+    """
+    
+    __slots__ = ('_data',)
+    
+    def __init__(self, q: np.ndarray):
+        """
+        Initialize quaternion array
+        
+        Parameters:
+        -----------
+        q : array-like
+            Quaternions of shape (N, 4), scalar part first
+        """
+        q = np.asarray(q, dtype=float)
+        if q.ndim != 2 or q.shape[1] != 4:
+            raise ValueError("Quaternion array must have shape (N, 4)")
+        self._data = np.ascontiguousarray(q.T)
+    
+    @classmethod
+    def from_aos(cls, q: np.ndarray) -> 'QuaternionArray':
+        """
+        Create from an array-of-structures (N, 4) quaternion array
+        
+        Parameters:
+        -----------
+        q : array-like
+            Quaternions of shape (N, 4), scalar part first
+            
+        Returns:
+        --------
+        QuaternionArray
+            Quaternion array
+        """
+        return cls(q)
+    
+    @classmethod
+    def from_scipy(cls, rotation) -> 'QuaternionArray':
+        """
+        Create from a scipy.spatial.transform.Rotation
+        
+        Parameters:
+        -----------
+        rotation : scipy.spatial.transform.Rotation
+            Single or stacked rotation
+            
+        Returns:
+        --------
+        QuaternionArray
+            Quaternions in scalar-first order
+        """
+        q = np.atleast_2d(rotation.as_quat())  # scipy order is [x, y, z, w]
+        obj = cls.__new__(cls)
+        obj._data = np.ascontiguousarray(q[:, [3, 0, 1, 2]].T)
+        return obj
+    
+    def to_scipy(self):
+        """
+        Convert to a scipy.spatial.transform.Rotation
+        
+        Gives access to SciPy's compiled batch routines (apply, Slerp,
+        as_euler for any sequence, ...) without a per-quaternion loop.
+        
+        Returns:
+        --------
+        scipy.spatial.transform.Rotation
+            Stacked rotation of length N
+        """
+        # Imported here so that loading this module does not pull in scipy.spatial
+        from scipy.spatial.transform import Rotation
+        return Rotation.from_quat(self._data[[1, 2, 3, 0]].T)
+    
+    @classmethod
+    def from_rotation_matrices(cls, matrices: np.ndarray, check: bool = False) -> 'QuaternionArray':
+        """
+        Create quaternions from a stack of rotation matrices
+        
+        Parameters:
+        -----------
+        matrices : np.ndarray
+            Rotation matrices of shape (N, 3, 3); assumed orthogonal
+        check : bool
+            Validate every matrix with is_rotation_matrix first
+            
+        Returns:
+        --------
+        QuaternionArray
+            One quaternion per matrix
+        """
+        R = np.asarray(matrices, dtype=float)
+        if R.ndim != 3 or R.shape[1:] != (3, 3):
+            raise ValueError("Rotation matrices must have shape (N, 3, 3)")
+        if check and not all(is_rotation_matrix(M) for M in R):
+            raise ValueError("Not all matrices are proper rotation matrices")
+        
+        obj = cls.__new__(cls)
+        obj._data = np.ascontiguousarray(_shoemake_rows(R).T)
+        return obj
+    
+    def to_aos(self) -> np.ndarray:
+        """
+        Copy out as a contiguous array-of-structures
+        
+        Returns:
+        --------
+        np.ndarray
+            Quaternions of shape (N, 4)
+        """
+        return np.ascontiguousarray(self._data.T)
+    
+    @classmethod
+    def from_euler_batch(cls, angles: np.ndarray, sequence: str = '321') -> 'QuaternionArray':
+        """
+        Create quaternions from many sets of Euler angles
+        
+        Parameters:
+        -----------
+        angles : array-like
+            Euler angles in radians, shape (N, 3) as [phi, theta, psi]
+        sequence : str
+            Rotation sequence (default '321' for yaw-pitch-roll)
+            
+        Returns:
+        --------
+        QuaternionArray
+            Quaternions for each row of angles
+        """
+        angles = np.asarray(angles, dtype=float)
+        if angles.ndim != 2 or angles.shape[1] != 3:
+            raise ValueError("Euler angles must have shape (N, 3)")
+        if sequence != '321':
+            raise NotImplementedError(f"Rotation sequence {sequence} not implemented")
+        
+        half = 0.5 * angles
+        c3, s3 = np.cos(half[:, 0]), np.sin(half[:, 0])  # roll
+        c2, s2 = np.cos(half[:, 1]), np.sin(half[:, 1])  # pitch
+        c1, s1 = np.cos(half[:, 2]), np.sin(half[:, 2])  # yaw
+        
+        obj = cls.__new__(cls)
+        obj._data = np.empty((4, len(angles)))
+        obj._data[0] = c1 * c2 * c3 + s1 * s2 * s3
+        obj._data[1] = c1 * c2 * s3 - s1 * s2 * c3
+        obj._data[2] = c1 * s2 * c3 + s1 * c2 * s3
+        obj._data[3] = s1 * c2 * c3 - c1 * s2 * s3
+        return obj
+    
+    def to_euler_batch(self, sequence: str = '321') -> np.ndarray:
+        """
+        Convert all quaternions to Euler angles
+        
+        Parameters:
+        -----------
+        sequence : str
+            Rotation sequence (default '321')
+            
+        Returns:
+        --------
+        np.ndarray
+            Euler angles in radians, shape (N, 3) as [phi, theta, psi]
+        """
+        if sequence != '321':
+            raise NotImplementedError(f"Rotation sequence {sequence} not implemented")
+        
+        q0, q1, q2, q3 = self._data
+        
+        angles = np.empty((self._data.shape[1], 3))
+        angles[:, 0] = np.arctan2(2*(q0*q1 + q2*q3), 1 - 2*(q1**2 + q2**2))
+        angles[:, 1] = np.arcsin(np.clip(2*(q0*q2 - q3*q1), -1.0, 1.0))
+        angles[:, 2] = np.arctan2(2*(q0*q3 + q1*q2), 1 - 2*(q2**2 + q3**2))
+        return angles
+    
+    def __mul__(self, other: Union['QuaternionArray', Quaternion]) -> 'QuaternionArray':
+        """
+        Element-wise quaternion multiplication
+        
+        Array-by-array products run in one compiled pass over the
+        contiguous component rows; a single quaternion is broadcast with
+        NumPy expressions.
+        
+        Parameters:
+        -----------
+        other : QuaternionArray or Quaternion
+            Quaternions of the same length, or a single quaternion applied
+            to every element
+            
+        Returns:
+        --------
+        QuaternionArray
+            Products self[k] * other[k]
+        """
+        result = QuaternionArray.__new__(QuaternionArray)
+        if isinstance(other, QuaternionArray):
+            if len(other) != len(self):
+                raise ValueError("Quaternion arrays must have the same length")
+            result._data = _quat_mul_soa(self._data, other._data, np.empty_like(self._data))
+            return result
+        
+        q0, q1, q2, q3 = self._data
+        if isinstance(other, Quaternion):
+            p0, p1, p2, p3 = (float(c) for c in other.q)
+        else:
+            raise TypeError("Unsupported type for multiplication")
+        
+        result._data = np.empty((4, len(self)))
+        result._data[0] = q0*p0 - q1*p1 - q2*p2 - q3*p3
+        result._data[1] = q0*p1 + q1*p0 + q2*p3 - q3*p2
+        result._data[2] = q0*p2 - q1*p3 + q2*p0 + q3*p1
+        result._data[3] = q0*p3 + q1*p2 - q2*p1 + q3*p0
+        return result
+    
+    def to_rotation_matrices(self, out: np.ndarray = None) -> np.ndarray:
+        """
+        Convert all (unit) quaternions to rotation matrices
+        
+        Uses R = (q0² - |v|²) I + 2 v vᵀ + 2 q0 [v]×: the nine pairwise
+        products are formed once as length-N rows and written straight
+        into the output.
+        
+        Parameters:
+        -----------
+        out : np.ndarray, optional
+            Float array of shape (N, 3, 3) receiving the matrices;
+            allocated if None
+            
+        Returns:
+        --------
+        np.ndarray
+            Rotation matrices of shape (N, 3, 3)
+        """
+        q0, q1, q2, q3 = self._data
+        
+        xx, yy, zz = q1*q1, q2*q2, q3*q3
+        xy, xz, yz = q1*q2, q1*q3, q2*q3
+        wx, wy, wz = q0*q1, q0*q2, q0*q3
+        
+        R = np.empty((len(self), 3, 3)) if out is None else out
+        R[:, 0, 0] = 1.0 - 2.0*(yy + zz)
+        R[:, 0, 1] = 2.0*(xy - wz)
+        R[:, 0, 2] = 2.0*(xz + wy)
+        R[:, 1, 0] = 2.0*(xy + wz)
+        R[:, 1, 1] = 1.0 - 2.0*(xx + zz)
+        R[:, 1, 2] = 2.0*(yz - wx)
+        R[:, 2, 0] = 2.0*(xz - wy)
+        R[:, 2, 1] = 2.0*(yz + wx)
+        R[:, 2, 2] = 1.0 - 2.0*(xx + yy)
+        return R
+    
+    @property
+    def q(self) -> np.ndarray:
+        """Quaternions as an (N, 4) view"""
+        return self._data.T
+    
+    @property
+    def q0(self) -> np.ndarray:
+        """Scalar parts (contiguous view)"""
+        return self._data[0]
+    
+    @property
+    def q1(self) -> np.ndarray:
+        """First vector components (contiguous view)"""
+        return self._data[1]
+    
+    @property
+    def q2(self) -> np.ndarray:
+        """Second vector components (contiguous view)"""
+        return self._data[2]
+    
+    @property
+    def q3(self) -> np.ndarray:
+        """Third vector components (contiguous view)"""
+        return self._data[3]
+    
+    def __len__(self) -> int:
+        return self._data.shape[1]
+    
+    def __getitem__(self, index: int) -> Quaternion:
+        return Quaternion(self._data[:, index])
+    
+    def __str__(self) -> str:
+        return f"QuaternionArray({len(self)} quaternions)"
+
+def _shoemake_rows(R: np.ndarray) -> np.ndarray:
+    """
+    Quaternions (N, 4) from rotation matrices (N, 3, 3), branch-free
+    
+    Builds M = 4 q qᵀ from the trace and R ± Rᵀ, then takes the row k with
+    the largest diagonal and divides it by sqrt(M[k, k]) = 2|q_k|.
+    """
+    trace = R[:, 0, 0] + R[:, 1, 1] + R[:, 2, 2]
+    a = R[:, 2, 1] - R[:, 1, 2]  # 4 q0 q1
+    b = R[:, 0, 2] - R[:, 2, 0]  # 4 q0 q2
+    c = R[:, 1, 0] - R[:, 0, 1]  # 4 q0 q3
+    d = R[:, 0, 1] + R[:, 1, 0]  # 4 q1 q2
+    e = R[:, 0, 2] + R[:, 2, 0]  # 4 q1 q3
+    f = R[:, 1, 2] + R[:, 2, 1]  # 4 q2 q3
+    
+    M = np.empty((len(R), 4, 4))
+    M[:, 0] = np.stack([1.0 + trace, a, b, c], axis=-1)
+    M[:, 1] = np.stack([a, 1.0 + 2.0*R[:, 0, 0] - trace, d, e], axis=-1)
+    M[:, 2] = np.stack([b, d, 1.0 + 2.0*R[:, 1, 1] - trace, f], axis=-1)
+    M[:, 3] = np.stack([c, e, f, 1.0 + 2.0*R[:, 2, 2] - trace], axis=-1)
+    
+    rows = np.arange(len(R))
+    k = np.argmax(M[:, [0, 1, 2, 3], [0, 1, 2, 3]], axis=1)
+    best = M[rows, k]
+    return best / (2.0 * np.sqrt(best[rows, k]))[:, None]
+
+def quaternion_multiply_batch(Q: np.ndarray, P: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    """
+    Multiply arrays of quaternions row by row
+    
+    Parameters:
+    -----------
+    Q, P : np.ndarray
+        Quaternions of shape (N, 4) (or (4,), broadcast against the other)
+    out : np.ndarray, optional
+        Float array of shape (N, 4) receiving the products (may alias Q
+        or P); allocated if None
+        
+    Returns:
+    --------
+    np.ndarray
+        Products Q[k] * P[k], shape (N, 4)
+    """
+    Q = np.asarray(Q)
+    P = np.asarray(P)
+    q0, q1, q2, q3 = Q[..., 0], Q[..., 1], Q[..., 2], Q[..., 3]
+    p0, p1, p2, p3 = P[..., 0], P[..., 1], P[..., 2], P[..., 3]
+    
+    r0 = q0*p0 - q1*p1 - q2*p2 - q3*p3
+    r1 = q0*p1 + q1*p0 + q2*p3 - q3*p2
+    r2 = q0*p2 - q1*p3 + q2*p0 + q3*p1
+    r3 = q0*p3 + q1*p2 - q2*p1 + q3*p0
+    
+    if out is None:
+        return np.stack([r0, r1, r2, r3], axis=-1)
+    out[..., 0] = r0
+    out[..., 1] = r1
+    out[..., 2] = r2
+    out[..., 3] = r3
+    return out
+
+def slerp(q1: Union[Quaternion, list, tuple, np.ndarray],
+          q2: Union[Quaternion, list, tuple, np.ndarray], t: float) -> Quaternion:
+    """
+    Spherical linear interpolation between two unit quaternions
+    
+    Parameters:
+    -----------
+    q1, q2 : Quaternion or array-like
+        Start and end quaternions [q0, q1, q2, q3]
+    t : float
+        Interpolation parameter in [0, 1]
+        
+    Returns:
+    --------
+    Quaternion
+        Interpolated unit quaternion
+    """
+    a = q1.q if isinstance(q1, Quaternion) else np.asarray(q1, dtype=float)
+    b = q2.q if isinstance(q2, Quaternion) else np.asarray(q2, dtype=float)
+    t = float(t)
+    
+    cos_half_theta = float(np.dot(a, b))
+    # q and -q are the same rotation: take the shorter arc
+    if cos_half_theta < 0.0:
+        b = -b
+        cos_half_theta = -cos_half_theta
+    
+    if cos_half_theta > 0.9995:
+        # Nearly parallel: plain linear interpolation is accurate enough
+        r1, r2 = 1.0 - t, t
+    else:
+        # Eberly polynomial weights: no arccos/sin on the scalar path
+        r1, r2 = _slerp_coefficients(cos_half_theta, t)
+    
+    return Quaternion(r1 * a + r2 * b).normalize()
+
+def slerp_batch(q1: np.ndarray, q2: np.ndarray, t: Union[float, np.ndarray],
+                out: np.ndarray = None) -> np.ndarray:
+    """
+    Spherical linear interpolation for arrays of quaternions
+    
+    Vectorized counterpart of slerp: every step is a NumPy ufunc over the
+    whole batch, and the near-parallel lerp fallback is selected with
+    np.where instead of a per-row branch.
+    
+    Parameters:
+    -----------
+    q1, q2 : np.ndarray
+        Start and end unit quaternions, shape (N, 4); a single (4,)
+        quaternion is treated as N = 1
+    t : float or np.ndarray
+        Interpolation parameter(s) in [0, 1], scalar or shape (N,)
+    out : np.ndarray, optional
+        Float array of shape (N, 4) receiving the result; allocated if None
+        
+    Returns:
+    --------
+    np.ndarray
+        Interpolated unit quaternions, shape (N, 4)
+    """
+    q1 = np.atleast_2d(np.asarray(q1, dtype=float))
+    q2 = np.atleast_2d(np.asarray(q2, dtype=float))
+    t = np.atleast_1d(np.asarray(t, dtype=float))
+    
+    if q1.ndim != 2 or q1.shape[1] != 4 or q1.shape != q2.shape:
+        raise ValueError(f"q1 and q2 must both have shape (N, 4), "
+                         f"got {q1.shape} and {q2.shape}")
+    if t.ndim != 1 or t.shape[0] not in (1, q1.shape[0]):
+        raise ValueError(f"t must be a scalar or have shape ({q1.shape[0]},), "
+                         f"got {t.shape}")
+    
+    cos_half_theta = np.einsum('ij,ij->i', q1, q2)
+    # Antipodal flip without modifying the caller's array
+    sign = np.where(cos_half_theta < 0.0, -1.0, 1.0)
+    q2 = q2 * sign[:, None]
+    cos_half_theta = np.abs(cos_half_theta)
+    
+    lerp = cos_half_theta > 0.9995
+    half_theta = np.arccos(np.clip(cos_half_theta, -1.0, 1.0))
+    sin_half_theta = np.sqrt(1.0 - cos_half_theta * cos_half_theta)
+    sin_half_theta = np.where(lerp, 1.0, sin_half_theta)
+    
+    r1 = np.where(lerp, 1.0 - t, np.sin((1.0 - t) * half_theta) / sin_half_theta)
+    r2 = np.where(lerp, t, np.sin(t * half_theta) / sin_half_theta)
+    
+    result = np.multiply(r1[:, None], q1, out=out)
+    result += r2[:, None] * q2
+    result /= np.linalg.norm(result, axis=1, keepdims=True)
+    return result
+
 def quaternion_from_euler(angles: Union[list, tuple, np.ndarray], 
                          sequence: str = '321') -> Quaternion:
     """
@@ -216,4 +839,4 @@ def euler_from_quaternion(q: Union[Quaternion, list, tuple, np.ndarray],
         q = Quaternion(q)
     return q.to_euler_angles(sequence)
 
-__all__ = ['Quaternion', 'quaternion_from_euler', 'euler_from_quaternion']
+__all__ = ['Quaternion', 'QuaternionArray', 'quaternion_multiply_batch', 'slerp', 'slerp_batch', 'quaternion_from_euler', 'euler_from_quaternion']
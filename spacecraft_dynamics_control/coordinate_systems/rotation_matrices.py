@@ -5,9 +5,17 @@ This module provides comprehensive rotation matrix operations for 3D coordinate
 in spacecraft attitude dynamics and control.
 """
 
+import math
 import numpy as np
 from typing import Union, Tuple
 
+from .._kernels import (_quat_to_rotation_matrix, _euler_321_matrix,
+                        _rotation_x, _rotation_y, _rotation_z,
+                        _is_rotation_matrix, _axis_angle_matrix)
+
+# Compiled elementary-rotation kernels by axis name
+_AXIS_KERNELS = {'x': _rotation_x, 'y': _rotation_y, 'z': _rotation_z}
+
 class RotationMatrix:
     """
     Rotation Matrix class for 3D coordinate transformations
@@ -16,6 +24,9 @@ class RotationMatrix:
     coordinate transformations between different reference frames.
     """
     
+    # No per-instance __dict__: each rotation is just its 3x3 array
+    __slots__ = ('matrix',)
+    
     def __init__(self, matrix: np.ndarray = None):
         """
         Initialize rotation matrix
@@ -32,6 +43,13 @@ class RotationMatrix:
                 raise ValueError("Rotation matrix must be 3x3")
             self.matrix = matrix
     
+    @classmethod
+    def _wrap(cls, matrix: np.ndarray) -> 'RotationMatrix':
+        """Wrap an already-validated 3x3 array without re-checking its shape"""
+        obj = cls.__new__(cls)
+        obj.matrix = matrix
+        return obj
+    
     @classmethod
     def from_euler_angles(cls, angles: Union[list, tuple, np.ndarray], 
                          sequence: str = '321') -> 'RotationMatrix':
@@ -54,23 +72,13 @@ class RotationMatrix:
         if len(angles) != 3:
             raise ValueError("Must provide exactly 3 Euler angles")
         
-        phi, theta, psi = angles
+        phi, theta, psi = (float(a) for a in angles)
         
         # Default sequence: 3-2-1 (yaw-pitch-roll)
         if sequence == '321':
-            R1 = np.array([[1, 0, 0],
-                          [0, np.cos(phi), np.sin(phi)],
-                          [0, -np.sin(phi), np.cos(phi)]])
-            
-            R2 = np.array([[np.cos(theta), 0, -np.sin(theta)],
-                          [0, 1, 0],
-                          [np.sin(theta), 0, np.cos(theta)]])
-            
-            R3 = np.array([[np.cos(psi), np.sin(psi), 0],
-                          [-np.sin(psi), np.cos(psi), 0],
-                          [0, 0, 1]])
-            
-            matrix = R1 @ R2 @ R3
+            # Closed form of R1(phi) @ R2(theta) @ R3(psi), filled by a
+            # compiled kernel
+            matrix = _euler_321_matrix(phi, theta, psi, np.empty((3, 3)))
             
         else:
             raise NotImplementedError(f"Rotation sequence {sequence} not implemented")
@@ -92,34 +100,41 @@ class RotationMatrix:
         RotationMatrix
             Rotation matrix object
         """
-        q = np.array(q)
+        q = np.array(q, dtype=float)
         if len(q) != 4:
             raise ValueError("Quaternion must have 4 elements")
         
-        q0, q1, q2, q3 = q
-        
         # Normalize quaternion
-        q_norm = np.linalg.norm(q)
-        q0, q1, q2, q3 = q / q_norm
+        q0, q1, q2, q3 = q.tolist()
+        q /= math.sqrt(q0*q0 + q1*q1 + q2*q2 + q3*q3)
         
-        # Compute rotation matrix elements
-        R11 = 1 - 2*(q2**2 + q3**2)
-        R12 = 2*(q1*q2 - q0*q3)
-        R13 = 2*(q1*q3 + q0*q2)
+        # Elements filled in place by a compiled kernel, no temporaries
+        matrix = _quat_to_rotation_matrix(q, np.empty((3, 3)))
         
-        R21 = 2*(q1*q2 + q0*q3)
-        R22 = 1 - 2*(q1**2 + q3**2)
-        R23 = 2*(q2*q3 - q0*q1)
-        
-        R31 = 2*(q1*q3 - q0*q2)
-        R32 = 2*(q2*q3 + q0*q1)
-        R33 = 1 - 2*(q1**2 + q2**2)
+        return cls(matrix)
+    
+    @classmethod
+    def from_axis_angle(cls, axis: Union[list, tuple, np.ndarray], angle: float) -> 'RotationMatrix':
+        """
+        Create rotation matrix from a rotation axis and angle (Rodrigues)
         
-        matrix = np.array([[R11, R12, R13],
-                          [R21, R22, R23],
-                          [R31, R32, R33]])
+        Parameters:
+        -----------
+        axis : array-like
+            Rotation axis (need not be normalized, must be non-zero)
+        angle : float
+            Rotation angle in radians
+            
+        Returns:
+        --------
+        RotationMatrix
+            Rotation matrix object (same convention as from_quaternion)
+        """
+        axis = np.ascontiguousarray(axis, dtype=np.float64)
+        if len(axis) != 3:
+            raise ValueError("Rotation axis must have 3 elements")
         
-        return cls(matrix)
+        return cls._wrap(_axis_angle_matrix(axis, float(angle), np.empty((3, 3))))
     
     def transform_vector(self, vector: np.ndarray) -> np.ndarray:
         """
@@ -146,7 +161,7 @@ class RotationMatrix:
         RotationMatrix
             Inverse rotation matrix
         """
-        return RotationMatrix(self.matrix.T)
+        return RotationMatrix._wrap(self.matrix.T)
     
     def __matmul__(self, other: Union['RotationMatrix', np.ndarray]) -> Union['RotationMatrix', np.ndarray]:
         """
@@ -162,8 +177,11 @@ class RotationMatrix:
         RotationMatrix or np.ndarray
             Result of multiplication
         """
-        if isinstance(other, RotationMatrix):
-            return RotationMatrix(self.matrix @ other.matrix)
+        # Plain arrays (vectors) are the common case in transform chains
+        if type(other) is np.ndarray:
+            return self.matrix @ other
+        elif isinstance(other, RotationMatrix):
+            return RotationMatrix._wrap(self.matrix @ other.matrix)
         elif isinstance(other, np.ndarray):
             return self.matrix @ other
         else:
@@ -189,25 +207,35 @@ def create_rotation_matrix(axis: str, angle: float) -> np.ndarray:
     np.ndarray
         3x3 rotation matrix
     """
-    cos_a = np.cos(angle)
-    sin_a = np.sin(angle)
-    
-    if axis == 'x':
-        return np.array([[1, 0, 0],
-                        [0, cos_a, sin_a],
-                        [0, -sin_a, cos_a]])
-    elif axis == 'y':
-        return np.array([[cos_a, 0, -sin_a],
-                        [0, 1, 0],
-                        [sin_a, 0, cos_a]])
-    elif axis == 'z':
-        return np.array([[cos_a, sin_a, 0],
-                        [-sin_a, cos_a, 0],
-                        [0, 0, 1]])
-    else:
+    kernel = _AXIS_KERNELS.get(axis)
+    if kernel is None:
         raise ValueError("Axis must be 'x', 'y', or 'z'")
+    
+    return kernel(float(angle), np.empty((3, 3)))
+
+def is_rotation_matrix(matrix: np.ndarray, tol: float = 1e-6) -> bool:
+    """
+    Check whether a matrix is a proper rotation (orthogonal, det = +1)
+    
+    Parameters:
+    -----------
+    matrix : np.ndarray
+        Matrix to check
+    tol : float
+        Absolute tolerance on RᵀR = I and det(R) = 1
+        
+    Returns:
+    --------
+    bool
+        True if matrix is a 3x3 rotation matrix
+    """
+    R = np.asarray(matrix, dtype=float)
+    if R.shape != (3, 3):
+        return False
+    # Column dot products and closed-form determinant in a compiled kernel
+    return bool(_is_rotation_matrix(R, float(tol)))
 
 # For backward compatibility
 RotationMatrix3D = RotationMatrix
 
-__all__ = ['RotationMatrix', 'RotationMatrix3D', 'create_rotation_matrix']
+__all__ = ['RotationMatrix', 'RotationMatrix3D', 'create_rotation_matrix', 'is_rotation_matrix']
@@ -0,0 +1,21 @@
+"""
+Shared pytest setup.
+
+The case-study and mission-simulation scripts are standalone files rather
+than packages, so their directories are put on sys.path for the tests.
+"""
+
+import os
+import sys
+
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+for path in (
+    ROOT,
+    os.path.join(ROOT, 'case_studies', 'textbook_problems', 'chapter_06'),
+    os.path.join(ROOT, 'applications', 'mission_simulations', 'earth_observation'),
+):
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,74 @@
+"""
+Tests for the orbit propagators of problem 6.1
+"""
+
+import numpy as np
+import pytest
+
+from problem_6_1_keplerian_orbit import OrbitPropagator, compute_invariants, define_parameters
+
+MU = 398600.4418  # [km³/s²]
+R0 = 7000.0       # [km]
+
+
+def _propagator(speed, flight_path_angle=0.3):
+    """Propagator for a 6000 s arc starting at R0 with the given speed"""
+    params = define_parameters()
+    params['r0'] = np.array([R0, 0.0, 0.0])
+    params['v0'] = speed * np.array([0.0, np.cos(flight_path_angle),
+                                     np.sin(flight_path_angle)])
+    return OrbitPropagator(params)
+
+
+@pytest.mark.parametrize('speed', [
+    7.5,                              # elliptic, e < 1
+    np.sqrt(2.0 * MU / R0),           # parabolic, e = 1
+    1.2 * np.sqrt(2.0 * MU / R0),     # hyperbolic, e > 1
+], ids=['elliptic', 'parabolic', 'hyperbolic'])
+def test_kepler_matches_dop853(speed):
+    propagator = _propagator(speed)
+    
+    analytic = propagator.propagate('kepler')
+    numerical = propagator.propagate('DOP853', rtol=1e-12, atol=1e-12)
+    
+    assert numerical['success']
+    np.testing.assert_allclose(analytic['t'], numerical['t'])
+    np.testing.assert_allclose(analytic['position'], numerical['position'],
+                               rtol=1e-10, atol=1e-10)
+    np.testing.assert_allclose(analytic['velocity'], numerical['velocity'],
+                               rtol=1e-10, atol=1e-10)
+
+
+def test_yoshida4_error_bound():
+    # Default 6000 s LEO arc with a fixed 10 s step
+    propagator = OrbitPropagator(define_parameters())
+    
+    analytic = propagator.propagate('kepler')
+    yoshida = propagator.propagate('yoshida4')
+    
+    position_error = np.abs(yoshida['position'] - analytic['position']).max()
+    assert position_error < 1e-3  # [km]; measured 6.0e-4
+    
+    # Symplectic: the energy error stays bounded instead of drifting
+    _, _, energy, _ = compute_invariants(yoshida['position'], yoshida['velocity'],
+                                         propagator.mu)
+    assert np.abs(energy - energy[0]).max() < 1e-9 * abs(energy[0])
+    
+    # 4th order beats the 2nd-order Verlet base scheme by orders of magnitude
+    verlet = propagator.propagate('verlet')
+    assert position_error < 1e-2 * np.abs(verlet['position'] - analytic['position']).max()
+
+
+def test_propagate_batch_matches_single():
+    propagator = OrbitPropagator(define_parameters())
+    params = propagator.params
+    r0 = np.array([params['r0'], [7100.0, 0.0, 0.0]])
+    v0 = np.array([params['v0'], [0.0, 7.4, 0.1]])
+    
+    batch = propagator.propagate_batch(r0, v0, method='yoshida4')
+    single = propagator.propagate('yoshida4')
+    
+    assert batch['position'].shape == (2, len(single['t']), 3)
+    np.testing.assert_allclose(batch['t'], single['t'])
+    np.testing.assert_allclose(batch['position'][0], single['position'], rtol=1e-12)
+    np.testing.assert_allclose(batch['velocity'][0], single['velocity'], rtol=1e-12)
@@ -0,0 +1,178 @@
+"""
+Tests for the quaternion conversions in coordinate_systems
+"""
+
+import numpy as np
+import pytest
+from scipy.spatial.transform import Rotation
+
+from spacecraft_dynamics_control._kernels import _SLERP_U, _SLERP_V
+from spacecraft_dynamics_control.coordinate_systems import (
+    Quaternion, QuaternionArray, slerp, slerp_batch,
+)
+
+
+def _scalar_first(rotation):
+    """scipy quaternions reordered from [x, y, z, w] to [w, x, y, z]"""
+    return np.atleast_2d(rotation.as_quat())[:, [3, 0, 1, 2]]
+
+
+def _assert_same_rotation(q, p, atol=1e-12):
+    """q and p (N, 4) describe the same rotations (q and -q are equivalent)"""
+    np.testing.assert_allclose(np.abs(np.einsum('ij,ij->i', q, p)), 1.0,
+                               rtol=0, atol=atol)
+
+
+# Half-turns (trace -1) exercise every branch of the Shoemake selection
+HALF_TURNS = {
+    'x': (np.diag([1.0, -1.0, -1.0]), [0.0, 1.0, 0.0, 0.0]),
+    'y': (np.diag([-1.0, 1.0, -1.0]), [0.0, 0.0, 1.0, 0.0]),
+    'z': (np.diag([-1.0, -1.0, 1.0]), [0.0, 0.0, 0.0, 1.0]),
+    'xy': (Rotation.from_rotvec(np.pi * np.array([1.0, 1.0, 0.0]) / np.sqrt(2.0)).as_matrix(),
+           [0.0, 1.0 / np.sqrt(2.0), 1.0 / np.sqrt(2.0), 0.0]),
+}
+
+
+def test_from_rotation_matrices_matches_scipy():
+    rotations = Rotation.random(500, 1234)
+    matrices = rotations.as_matrix()
+    
+    q = QuaternionArray.from_rotation_matrices(matrices)
+    
+    _assert_same_rotation(q.to_aos(), _scalar_first(rotations))
+    np.testing.assert_allclose(q.to_rotation_matrices(), matrices, rtol=0, atol=1e-12)
+
+
+def test_from_rotation_matrix_matches_scipy():
+    rotations = Rotation.random(100, 4321)
+    
+    for rotation in rotations:
+        q = Quaternion.from_rotation_matrix(rotation.as_matrix())
+        _assert_same_rotation(q.q[None], _scalar_first(rotation))
+        np.testing.assert_allclose(q.to_rotation_matrix(), rotation.as_matrix(),
+                                   rtol=0, atol=1e-12)
+
+
+@pytest.mark.parametrize('axis', list(HALF_TURNS))
+def test_half_turns(axis):
+    matrix, expected = HALF_TURNS[axis]
+    expected = np.array([expected])
+    
+    _assert_same_rotation(Quaternion.from_rotation_matrix(matrix).q[None], expected)
+    _assert_same_rotation(QuaternionArray.from_rotation_matrices(matrix[None]).to_aos(),
+                          expected)
+    _assert_same_rotation(expected, _scalar_first(Rotation.from_matrix(matrix)))
+
+
+def test_rotation_matrix_check():
+    reflection = np.diag([1.0, 1.0, -1.0])
+    
+    with pytest.raises(ValueError):
+        Quaternion.from_rotation_matrix(reflection, check=True)
+    with pytest.raises(ValueError):
+        QuaternionArray.from_rotation_matrices(np.stack([np.eye(3), reflection]),
+                                               check=True)
+
+
+def test_aos_soa_round_trip():
+    q = _scalar_first(Rotation.random(50, 7))
+    
+    array = QuaternionArray.from_aos(q)
+    
+    assert len(array) == 50
+    np.testing.assert_array_equal(array.q, q)
+    np.testing.assert_array_equal(np.stack([array.q0, array.q1, array.q2, array.q3]), q.T)
+    assert array.q0.flags['C_CONTIGUOUS']
+    np.testing.assert_array_equal(array.to_aos(), q)
+    # scipy may flip q to -q on the way through
+    _assert_same_rotation(QuaternionArray.from_scipy(array.to_scipy()).to_aos(), q)
+    np.testing.assert_array_equal(array[3].q, q[3])
+
+
+def test_euler_batch_matches_scipy():
+    rng = np.random.default_rng(11)
+    angles = np.column_stack([rng.uniform(-np.pi, np.pi, 200),
+                              rng.uniform(-0.49 * np.pi, 0.49 * np.pi, 200),
+                              rng.uniform(-np.pi, np.pi, 200)])
+    
+    # [phi, theta, psi] in the 3-2-1 sequence is scipy's intrinsic 'ZYX' [psi, theta, phi]
+    expected = _scalar_first(Rotation.from_euler('ZYX', angles[:, ::-1]))
+    
+    q = QuaternionArray.from_euler_batch(angles)
+    _assert_same_rotation(q.to_aos(), expected)
+    np.testing.assert_allclose(q.to_euler_batch(), angles, rtol=0, atol=1e-12)
+    np.testing.assert_array_equal(Quaternion.from_euler_angles_batch(angles), q.to_aos())
+    
+    # The scalar path agrees with the batch path row by row
+    for row, q_row in zip(angles[:10], q.to_aos()):
+        np.testing.assert_allclose(Quaternion.from_euler_angles(row).q, q_row,
+                                   rtol=0, atol=1e-15)
+        np.testing.assert_allclose(Quaternion(q_row).to_euler_angles(), row,
+                                   rtol=0, atol=1e-12)
+
+
+def _scipy_slerp(q1, q2, t):
+    """Reference interpolation with scipy's Slerp, one pair at a time"""
+    from scipy.spatial.transform import Slerp
+    
+    out = np.empty_like(q1)
+    for k, (a, b) in enumerate(zip(q1, q2)):
+        key_rotations = Rotation.from_quat(np.array([a, b])[:, [1, 2, 3, 0]])
+        out[k] = _scalar_first(Slerp([0.0, 1.0], key_rotations)(t))[0]
+    return out
+
+
+@pytest.mark.parametrize('t', [0.0, 0.1, 0.25, 0.5, 0.8, 1.0])
+def test_slerp_matches_scipy(t):
+    q = _scalar_first(Rotation.random(200, 99))
+    q1, q2 = q[:100], q[100:]
+    expected = _scipy_slerp(q1, q2, t)
+    
+    # slerp_batch uses exact trigonometry
+    batch = slerp_batch(q1, q2, t)
+    _assert_same_rotation(batch, expected)
+    
+    # slerp uses Eberly's polynomial weights, accurate to about 1e-5
+    scalar = np.array([slerp(a, b, t).q for a, b in zip(q1, q2)])
+    sign = np.sign(np.einsum('ij,ij->i', scalar, expected))[:, None]
+    np.testing.assert_allclose(scalar, sign * expected, rtol=0, atol=1.5e-5)
+    np.testing.assert_allclose(scalar, sign * batch, rtol=0, atol=1.5e-5)
+
+
+def test_slerp_weights_over_full_range():
+    # Half-angles up to pi/2, where the high-order Eberly terms matter most
+    half_theta = np.linspace(0.03, 0.5 * np.pi, 400)
+    q1 = np.array([1.0, 0.0, 0.0, 0.0])
+    
+    for t in (0.1, 0.3, 0.5, 0.7, 0.9):
+        expected = np.column_stack([np.cos(t * half_theta), np.sin(t * half_theta)])
+        actual = np.array([slerp(q1, [np.cos(h), np.sin(h), 0.0, 0.0], t).q[:2]
+                           for h in half_theta])
+        np.testing.assert_allclose(actual, expected, rtol=0, atol=1.5e-5)
+
+
+def test_slerp_coefficient_tables():
+    # Eberly's u_i = 1/(i(2i+1)), v_i = i/(2i+1); the highest-order terms are
+    # below the accuracy tolerance above, so the tables are pinned directly
+    mu = 1.90110745351730037
+    expected_u = [1/3, 1/10, 1/21, 1/36, 1/55, 1/78, 1/105, mu/136]
+    expected_v = [1/3, 2/5, 3/7, 4/9, 5/11, 6/13, 7/15, 8*mu/17]
+    
+    np.testing.assert_allclose(_SLERP_U, expected_u, rtol=1e-15)
+    np.testing.assert_allclose(_SLERP_V, expected_v, rtol=1e-15)
+
+
+def test_slerp_short_arc_and_near_parallel():
+    q1 = np.array([1.0, 0.0, 0.0, 0.0])
+    q2 = np.array([np.cos(0.5), np.sin(0.5), 0.0, 0.0])
+    
+    # -q2 is the same rotation: both paths take the short arc
+    expected = np.array([np.cos(0.25), np.sin(0.25), 0.0, 0.0])
+    np.testing.assert_allclose(slerp(q1, -q2, 0.5).q, expected, rtol=0, atol=1.5e-5)
+    np.testing.assert_allclose(slerp_batch(q1, -q2, 0.5)[0], expected, rtol=0, atol=1e-12)
+    
+    # Near-parallel pairs fall back to normalized lerp
+    q3 = np.array([np.cos(1e-3), np.sin(1e-3), 0.0, 0.0])
+    expected = np.array([np.cos(5e-4), np.sin(5e-4), 0.0, 0.0])
+    np.testing.assert_allclose(slerp(q1, q3, 0.5).q, expected, rtol=0, atol=1e-12)
+    np.testing.assert_allclose(slerp_batch(q1, q3, 0.5)[0], expected, rtol=0, atol=1e-12)
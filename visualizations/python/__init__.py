@@ -2,9 +2,17 @@
 Spacecraft Dynamics Visualizations Package
 
 Advanced visualization tools for orbital mechanics and attitude dynamics.
+
+Subpackages (and the plotting libraries they pull in) are imported on
+first attribute access (PEP 562).
 """
-from . import advanced_plots
-from . import interactive
-from . import scientific_papers
+import importlib
+
+__all__ = ['advanced_plots']
 
-__all__ = ['advanced_plots', 'interactive', 'scientific_papers']
+def __getattr__(name):
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f'.{name}', __name__)
+    globals()[name] = module
+    return module
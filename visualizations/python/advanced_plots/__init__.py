@@ -1,7 +1,16 @@
 """
 Advanced plotting modules for spacecraft dynamics
+
+Modules are imported on first attribute access (PEP 562), so matplotlib
+and plotly are only loaded when a plot module is used.
 """
-from . import orbital_3d
-from . import attitude_animations
+import importlib
 
 __all__ = ['orbital_3d', 'attitude_animations']
+
+def __getattr__(name):
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f'.{name}', __name__)
+    globals()[name] = module
+    return module
@@ -5,14 +5,38 @@ Attitude animation visualizations for spacecraft dynamics
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
+from matplotlib.lines import Line2D
 from mpl_toolkits.mplot3d import Axes3D
 
 class AttitudeAnimator:
     """Animator for spacecraft attitude dynamics"""
     
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = ('fig', 'ax', '_q', '_R_all')
+    
+    # Reference (ECI) frame: one row per axis, drawn with a single quiver call
+    _REF_ORIGINS = np.zeros((3, 3))
+    _REF_DIRS = np.eye(3)
+    _REF_COLORS = ['r', 'g', 'b']
+    _REF_LABELS = ['X', 'Y', 'Z']
+    
     def __init__(self):
         self.fig = None
         self.ax = None
+        self._q = None  # Trajectory as (4, N) float32, one row per component
+        self._R_all = None
+        
+    def load_trajectory(self, quaternions):
+        """
+        Store a quaternion trajectory for animation
+        
+        Quaternions are kept as four contiguous float32 component rows
+        (ample precision for display, half the memory of float64), and
+        the rotation matrices of all frames are computed in one pass.
+        """
+        self._q = np.ascontiguousarray(np.asarray(quaternions, dtype=np.float32).T)
+        self._R_all = self._components_to_matrices(*self._q)
+        return self._R_all
         
     def animate_quaternion_evolution(self, time, quaternions):
         """Animate the evolution of quaternions over time"""
@@ -22,18 +46,22 @@ class AttitudeAnimator:
         # Set up the coordinate axes
         self._setup_reference_frame(ax)
         
+        # Rotation matrices for every frame, converted in one pass
+        R_all = self.load_trajectory(quaternions)
+        
+        # Only the body axes change between frames; the reference frame,
+        # limits, labels and legend are drawn once above
+        body_axes = []
+        
         def update(frame):
-            ax.clear()
-            self._setup_reference_frame(ax)
+            for artist in body_axes:
+                artist.remove()
             
-            # Get current quaternion
-            q = quaternions[frame]
-            
-            # Convert quaternion to rotation matrix
-            R = self.quaternion_to_rotation_matrix(q)
+            # Rotation matrix of the current quaternion
+            R = R_all[frame]
             
             # Draw spacecraft body axes
-            self._draw_body_axes(ax, R)
+            body_axes[:] = self._draw_body_axes(ax, R)
             
             ax.set_title(f'Time: {time[frame]:.2f}s')
             
@@ -54,12 +82,33 @@ class AttitudeAnimator:
         
         return R
     
+    @staticmethod
+    def quats_to_matrices(Q):
+        """Convert an (N, 4) array of quaternions to (N, 3, 3) rotation matrices"""
+        Q = np.asarray(Q, dtype=float)
+        return AttitudeAnimator._components_to_matrices(Q[:, 0], Q[:, 1], Q[:, 2], Q[:, 3])
+    
+    @staticmethod
+    def _components_to_matrices(q0, q1, q2, q3):
+        """Rotation matrices (N, 3, 3) from quaternion component arrays, in their dtype"""
+        R = np.empty((len(q0), 3, 3), dtype=q0.dtype)
+        R[:, 0, 0] = 1 - 2*(q2*q2 + q3*q3)
+        R[:, 0, 1] = 2*(q1*q2 - q0*q3)
+        R[:, 0, 2] = 2*(q1*q3 + q0*q2)
+        R[:, 1, 0] = 2*(q1*q2 + q0*q3)
+        R[:, 1, 1] = 1 - 2*(q1*q1 + q3*q3)
+        R[:, 1, 2] = 2*(q2*q3 - q0*q1)
+        R[:, 2, 0] = 2*(q1*q3 - q0*q2)
+        R[:, 2, 1] = 2*(q2*q3 + q0*q1)
+        R[:, 2, 2] = 1 - 2*(q1*q1 + q2*q2)
+        
+        return R
+    
     def _setup_reference_frame(self, ax):
         """Set up the reference coordinate system"""
-        # Reference axes (ECI frame)
-        ax.quiver(0, 0, 0, 1, 0, 0, color='r', label='X', linewidth=2)
-        ax.quiver(0, 0, 0, 0, 1, 0, color='g', label='Y', linewidth=2)
-        ax.quiver(0, 0, 0, 0, 0, 1, color='b', label='Z', linewidth=2)
+        # Reference axes (ECI frame), batched into one Line3DCollection
+        ax.quiver(*self._REF_ORIGINS.T, *self._REF_DIRS.T,
+                  colors=self._REF_COLORS, linewidth=2)
         
         ax.set_xlim([-1.5, 1.5])
         ax.set_ylim([-1.5, 1.5])
@@ -67,22 +116,26 @@ class AttitudeAnimator:
         ax.set_xlabel('X')
         ax.set_ylabel('Y')
         ax.set_zlabel('Z')
-        ax.legend()
+        # A single quiver has one legend entry, so label the axes with proxies
+        ax.legend(handles=[Line2D([], [], color=c, linewidth=2, label=l)
+                           for c, l in zip(self._REF_COLORS, self._REF_LABELS)])
     
     def _draw_body_axes(self, ax, rotation_matrix):
-        """Draw spacecraft body axes"""
-        # Body axes in body frame
-        body_x = rotation_matrix @ np.array([1, 0, 0])
-        body_y = rotation_matrix @ np.array([0, 1, 0])
-        body_z = rotation_matrix @ np.array([0, 0, 1])
+        """Draw spacecraft body axes; returns the three quiver artists"""
+        # Body axes are the columns of the rotation matrix
+        body_x = rotation_matrix[:, 0]
+        body_y = rotation_matrix[:, 1]
+        body_z = rotation_matrix[:, 2]
         
         # Draw body axes
-        ax.quiver(0, 0, 0, body_x[0], body_x[1], body_x[2], 
-                 color='r', linewidth=3, alpha=0.7, label='Body X')
-        ax.quiver(0, 0, 0, body_y[0], body_y[1], body_y[2], 
-                 color='g', linewidth=3, alpha=0.7, label='Body Y')
-        ax.quiver(0, 0, 0, body_z[0], body_z[1], body_z[2], 
-                 color='b', linewidth=3, alpha=0.7, label='Body Z')
+        return [
+            ax.quiver(0, 0, 0, body_x[0], body_x[1], body_x[2], 
+                     color='r', linewidth=3, alpha=0.7, label='Body X'),
+            ax.quiver(0, 0, 0, body_y[0], body_y[1], body_y[2], 
+                     color='g', linewidth=3, alpha=0.7, label='Body Y'),
+            ax.quiver(0, 0, 0, body_z[0], body_z[1], body_z[2], 
+                     color='b', linewidth=3, alpha=0.7, label='Body Z'),
+        ]
 
 if __name__ == "__main__":
     # Example usage
@@ -3,16 +3,156 @@ Advanced 3D orbital visualizations for spacecraft dynamics
 """
 
 import numpy as np
+from functools import lru_cache
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+from scipy.spatial.transform import Rotation
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; kernels then run as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+    prange = range
+
+# From this many samples on, the fused kernel is used instead of NumPy (below
+# it, thread start-up and the no-Numba fallback make NumPy the safer choice)
+PARALLEL_MIN_POINTS = 1000
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _orbit_points(a, e, i, raan, argp, n_points, out):
+    """
+    Fused orbit sampling: true anomaly, radius and rotation to the inertial
+    frame per point, in one parallel loop (angles in radians)
+    """
+    cos_r, sin_r = np.cos(raan), np.sin(raan)
+    cos_i, sin_i = np.cos(i), np.sin(i)
+    cos_w, sin_w = np.cos(argp), np.sin(argp)
+    
+    # First two columns of R3(raan) @ R1(i) @ R3(argp)
+    r00 = cos_r*cos_w - sin_r*cos_i*sin_w
+    r01 = -cos_r*sin_w - sin_r*cos_i*cos_w
+    r10 = sin_r*cos_w + cos_r*cos_i*sin_w
+    r11 = -sin_r*sin_w + cos_r*cos_i*cos_w
+    r20 = sin_i*sin_w
+    r21 = sin_i*cos_w
+    
+    p = a * (1 - e**2)
+    step = 2*np.pi / (n_points - 1) if n_points > 1 else 0.0
+    
+    for idx in prange(n_points):
+        ta = idx * step
+        cos_ta, sin_ta = np.cos(ta), np.sin(ta)
+        r = p / (1 + e*cos_ta)
+        x_orb = r * cos_ta
+        y_orb = r * sin_ta
+        
+        out[idx, 0] = r00*x_orb + r01*y_orb
+        out[idx, 1] = r10*x_orb + r11*y_orb
+        out[idx, 2] = r20*x_orb + r21*y_orb
+    
+    return out
+
+@lru_cache(maxsize=None)
+def _icosphere(subdivisions=2):
+    """
+    Unit icosphere: vertices (V, 3) and triangle indices (F, 3)
+    
+    Each subdivision splits every triangle into four and pushes the new
+    midpoints onto the sphere; two subdivisions give 162 vertices. Built
+    once per process and shared (read-only) by all visualizers.
+    """
+    t = (1 + np.sqrt(5)) / 2
+    vertices = [(-1, t, 0), (1, t, 0), (-1, -t, 0), (1, -t, 0),
+                (0, -1, t), (0, 1, t), (0, -1, -t), (0, 1, -t),
+                (t, 0, -1), (t, 0, 1), (-t, 0, -1), (-t, 0, 1)]
+    vertices = [tuple(np.array(v) / np.linalg.norm(v)) for v in vertices]
+    faces = [(0, 11, 5), (0, 5, 1), (0, 1, 7), (0, 7, 10), (0, 10, 11),
+             (1, 5, 9), (5, 11, 4), (11, 10, 2), (10, 7, 6), (7, 1, 8),
+             (3, 9, 4), (3, 4, 2), (3, 2, 6), (3, 6, 8), (3, 8, 9),
+             (4, 9, 5), (2, 4, 11), (6, 2, 10), (8, 6, 7), (9, 8, 1)]
+    
+    for _ in range(subdivisions):
+        midpoint_of = {}
+        
+        def midpoint(a, b):
+            key = (min(a, b), max(a, b))
+            if key not in midpoint_of:
+                m = (np.array(vertices[a]) + np.array(vertices[b])) / 2
+                vertices.append(tuple(m / np.linalg.norm(m)))
+                midpoint_of[key] = len(vertices) - 1
+            return midpoint_of[key]
+        
+        new_faces = []
+        for a, b, c in faces:
+            ab, bc, ca = midpoint(a, b), midpoint(b, c), midpoint(c, a)
+            new_faces += [(a, ab, ca), (b, bc, ab), (c, ca, bc), (ab, bc, ca)]
+        faces = new_faces
+    
+    vertices, faces = np.array(vertices), np.array(faces)
+    vertices.flags.writeable = False
+    faces.flags.writeable = False
+    return vertices, faces
+
+def _downsample(positions, max_points=5000):
+    """
+    Reduce a trajectory to at most max_points samples for plotting
+    
+    Half of the budget is spread uniformly along the track; the rest goes
+    to the points where the direction turns most sharply, so curved
+    stretches keep their shape. Endpoints are always kept, so max_points
+    must be at least 2.
+    """
+    if max_points < 2:
+        raise ValueError(f"max_points must be at least 2, got {max_points}")
+    
+    n = len(positions)
+    if n <= max_points:
+        return positions
+    
+    segments = np.diff(positions, axis=0)
+    lengths = np.linalg.norm(segments, axis=1)
+    directions = segments / np.where(lengths > 0, lengths, 1.0)[:, None]
+    
+    # Turning angle at each interior point (0 on straight stretches)
+    cos_turn = np.einsum('ij,ij->i', directions[:-1], directions[1:])
+    turn = np.arccos(np.clip(cos_turn, -1.0, 1.0))
+    
+    keep = np.zeros(n, dtype=bool)
+    keep[np.linspace(0, n - 1, max(2, max_points // 2)).astype(int)] = True
+    keep[0] = keep[-1] = True
+    n_extra = max_points - np.count_nonzero(keep)
+    if n_extra > 0:
+        keep[1 + np.argpartition(turn, -n_extra)[-n_extra:]] = True
+    
+    return positions[keep]
 
 class OrbitalVisualizer3D:
     """Advanced 3D visualizer for orbital mechanics"""
     
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = ('earth_radius', '_earth_xyz', '_earth_xyz_radius')
+    
     def __init__(self, earth_radius=6371):
         self.earth_radius = earth_radius  # km
+        self._earth_xyz = None  # Sphere mesh, built on first plot
+        self._earth_xyz_radius = None
+        
+    def _earth_mesh(self):
+        """Earth sphere mesh (x, y, z), rebuilt only if earth_radius changes"""
+        if self._earth_xyz is None or self._earth_xyz_radius != self.earth_radius:
+            u = np.linspace(0, 2 * np.pi, 100)
+            v = np.linspace(0, np.pi, 100)
+            x = self.earth_radius * np.outer(np.cos(u), np.sin(v))
+            y = self.earth_radius * np.outer(np.sin(u), np.sin(v))
+            z = self.earth_radius * np.outer(np.ones(np.size(u)), np.cos(v))
+            self._earth_xyz = (x, y, z)
+            self._earth_xyz_radius = self.earth_radius
+        return self._earth_xyz
         
     def plot_keplerian_orbit(self, a, e, i, raan, argp, nu):
         """Plot Keplerian orbit in 3D"""
@@ -23,11 +163,7 @@ class OrbitalVisualizer3D:
         ax = fig.add_subplot(111, projection='3d')
         
         # Plot Earth
-        u = np.linspace(0, 2 * np.pi, 100)
-        v = np.linspace(0, np.pi, 100)
-        x = self.earth_radius * np.outer(np.cos(u), np.sin(v))
-        y = self.earth_radius * np.outer(np.sin(u), np.sin(v))
-        z = self.earth_radius * np.outer(np.ones(np.size(u)), np.cos(v))
+        x, y, z = self._earth_mesh()
         
         ax.plot_surface(x, y, z, color='b', alpha=0.3)
         
@@ -42,9 +178,12 @@ class OrbitalVisualizer3D:
         
         return fig, ax
     
-    def orbital_elements_to_cartesian(self, a, e, i, raan, argp, nu):
+    def orbital_elements_to_cartesian(self, a, e, i, raan, argp, nu, n_points=100):
         """Convert orbital elements to Cartesian coordinates"""
-        n_points = 100
+        if n_points >= PARALLEL_MIN_POINTS:
+            return _orbit_points(float(a), float(e), np.radians(i), np.radians(raan),
+                                 np.radians(argp), n_points, np.empty((n_points, 3)))
+        
         true_anomaly = np.linspace(0, 2*np.pi, n_points)
         
         # Semi-latus rectum
@@ -55,55 +194,29 @@ class OrbitalVisualizer3D:
         x_orb = r * np.cos(true_anomaly)
         y_orb = r * np.sin(true_anomaly)
         
-        # Convert to radians
-        i_rad = np.radians(i)
-        raan_rad = np.radians(raan)
-        argp_rad = np.radians(argp)
-        
-        # Transformation matrix
-        positions = np.zeros((n_points, 3))
-        for idx, ta in enumerate(true_anomaly):
-            # Position in perifocal frame
-            r_pf = np.array([x_orb[idx], y_orb[idx], 0])
-            
-            # Rotation matrices
-            R3_raan = np.array([
-                [np.cos(raan_rad), -np.sin(raan_rad), 0],
-                [np.sin(raan_rad), np.cos(raan_rad), 0],
-                [0, 0, 1]
-            ])
-            
-            R1_i = np.array([
-                [1, 0, 0],
-                [0, np.cos(i_rad), -np.sin(i_rad)],
-                [0, np.sin(i_rad), np.cos(i_rad)]
-            ])
-            
-            R3_argp = np.array([
-                [np.cos(argp_rad), -np.sin(argp_rad), 0],
-                [np.sin(argp_rad), np.cos(argp_rad), 0],
-                [0, 0, 1]
-            ])
-            
-            # Combined rotation
-            R = R3_raan @ R1_i @ R3_argp
-            positions[idx] = R @ r_pf
+        # Perifocal -> inertial: intrinsic Z-X-Z rotation (raan, i, argp),
+        # applied to all positions at once
+        rotation = Rotation.from_euler('ZXZ', [raan, i, argp], degrees=True)
+        positions = rotation.apply(np.column_stack([x_orb, y_orb, np.zeros(n_points)]))
         
         return positions
     
-    def create_interactive_plot(self, positions, title="3D Orbital Trajectory"):
+    def create_interactive_plot(self, positions, title="3D Orbital Trajectory", max_points=5000):
         """Create interactive 3D plot using Plotly"""
         fig = go.Figure()
         
-        # Add Earth
-        fig.add_trace(go.Scatter3d(
-            x=[0], y=[0], z=[0],
-            mode='markers',
-            marker=dict(size=20, color='blue', opacity=0.8),
+        # Add Earth as a true-scale sphere
+        vertices, faces = _icosphere(2)
+        vertices = self.earth_radius * vertices
+        fig.add_trace(go.Mesh3d(
+            x=vertices[:, 0], y=vertices[:, 1], z=vertices[:, 2],
+            i=faces[:, 0], j=faces[:, 1], k=faces[:, 2],
+            color='blue', opacity=0.8,
             name='Earth'
         ))
         
-        # Add trajectory
+        # Add trajectory (downsampled to keep the HTML payload bounded)
+        positions = _downsample(positions, max_points)
         x, y, z = positions[:, 0], positions[:, 1], positions[:, 2]
         fig.add_trace(go.Scatter3d(
             x=x, y=y, z=z,